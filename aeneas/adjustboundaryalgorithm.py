@@ -322,57 +322,54 @@ class AdjustBoundaryAlgorithm(Configurable):
             "  Creating SyncMapFragmentList with begin %.3f and end %.3f", begin, end
         )
         self.smflist = SyncMapFragmentList(begin=begin, end=end)
-        logger.debug("  Creating HEAD fragment")
-        self.smflist.add(
-            SyncMapFragment.from_begin_end(
-                begin=time_values[0],
-                end=time_values[1],
-                # NOTE lines and filtered lines MUST be set,
-                #      otherwise some output format might break
-                #      when adding HEAD/TAIL to output
-                text_fragment=TextFragment(
-                    identifier="HEAD", lines=[], filtered_lines=[]
-                ),
-                fragment_type=FragmentType.HEAD,
-            ),
-            sort=False,
-        )
-        logger.debug("  Creating REGULAR fragments")
-        # NOTE text_file.fragments() returns a list,
-        #      so we cache a copy here instead of
-        #      calling it once per loop
-        fragments = text_file.fragments
-        for i in range(1, len(time_values) - 2):
-            logger.debug("    Adding fragment %d ...", i)
+        # NOTE the fragments are created in order,
+        #      so we add them all and sort (and check) the list once
+        with self.smflist.deferred_sort():
+            logger.debug("  Creating HEAD fragment")
             self.smflist.add(
                 SyncMapFragment.from_begin_end(
-                    begin=time_values[i],
-                    end=time_values[i + 1],
-                    text_fragment=fragments[i - 1],
-                    fragment_type=FragmentType.REGULAR,
+                    begin=time_values[0],
+                    end=time_values[1],
+                    # NOTE lines and filtered lines MUST be set,
+                    #      otherwise some output format might break
+                    #      when adding HEAD/TAIL to output
+                    text_fragment=TextFragment(
+                        identifier="HEAD", lines=[], filtered_lines=[]
+                    ),
+                    fragment_type=FragmentType.HEAD,
                 ),
-                sort=False,
             )
-            logger.debug("    Adding fragment %d ... done", i)
-        logger.debug("  Creating TAIL fragment")
-        self.smflist.add(
-            SyncMapFragment.from_begin_end(
-                begin=time_values[len(time_values) - 2],
-                end=end,
-                # NOTE lines and filtered lines MUST be set,
-                #      otherwise some output format might break
-                #      when adding HEAD/TAIL to output
-                text_fragment=TextFragment(
-                    identifier="TAIL", lines=[], filtered_lines=[]
+            logger.debug("  Creating REGULAR fragments")
+            # NOTE text_file.fragments() returns a list,
+            #      so we cache a copy here instead of
+            #      calling it once per loop
+            fragments = text_file.fragments
+            for i in range(1, len(time_values) - 2):
+                logger.debug("    Adding fragment %d ...", i)
+                self.smflist.add(
+                    SyncMapFragment.from_begin_end(
+                        begin=time_values[i],
+                        end=time_values[i + 1],
+                        text_fragment=fragments[i - 1],
+                        fragment_type=FragmentType.REGULAR,
+                    ),
+                )
+                logger.debug("    Adding fragment %d ... done", i)
+            logger.debug("  Creating TAIL fragment")
+            self.smflist.add(
+                SyncMapFragment.from_begin_end(
+                    begin=time_values[len(time_values) - 2],
+                    end=end,
+                    # NOTE lines and filtered lines MUST be set,
+                    #      otherwise some output format might break
+                    #      when adding HEAD/TAIL to output
+                    text_fragment=TextFragment(
+                        identifier="TAIL", lines=[], filtered_lines=[]
+                    ),
+                    fragment_type=FragmentType.TAIL,
                 ),
-                fragment_type=FragmentType.TAIL,
-            ),
-            sort=False,
-        )
+            )
         logger.debug("Converting time values to fragment list... done")
-        logger.debug("Sorting fragment list...")
-        self.smflist.sort()
-        logger.debug("Sorting fragment list... done")
         return self.smflist
 
     def append_fragment_list_to_sync_root(self, sync_root: Tree):
@@ -625,11 +622,8 @@ class AdjustBoundaryAlgorithm(Configurable):
             logger.debug("  The list contains at most one regular fragment, returning")
             return
 
-        faster_fragments = [
-            (i, f)
-            for i, f in regular_fragments
-            if f.rate is not None and f.rate >= max_rate + decimal.Decimal("0.001")
-        ]
+        threshold = max_rate + decimal.Decimal("0.001")
+        faster_fragments = self.smflist.fragments_faster_than(threshold)
 
         if not faster_fragments:
             logger.debug("  No regular fragment faster than max rate, returning")
@@ -637,19 +631,15 @@ class AdjustBoundaryAlgorithm(Configurable):
 
         logger.warning(
             "  Some fragments have rate faster than max rate: %s",
-            [i for i, f in faster_fragments],
+            faster_fragments,
         )
         logger.debug("Fixing rate for faster fragments...")
-        for frag_index, fragment in faster_fragments:
+        for frag_index in faster_fragments:
             self.smflist.fix_fragment_rate(frag_index, max_rate, aggressive=aggressive)
         logger.debug("Fixing rate for faster fragments... done")
-        faster_fragments = [
-            (i, f)
-            for i, f in regular_fragments
-            if (f.rate is not None) and (f.rate >= max_rate + decimal.Decimal("0.001"))
-        ]
+        faster_fragments = self.smflist.fragments_faster_than(threshold)
         if faster_fragments:
             logger.warning(
                 "  Some fragments still have rate faster than max rate: %s",
-                [i for i, f in faster_fragments],
+                faster_fragments,
             )
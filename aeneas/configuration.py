@@ -31,6 +31,7 @@ This module contains the following classes:
 import copy
 import decimal
 import enum
+import functools
 import typing
 
 from aeneas.exacttiming import TimeValue
@@ -101,17 +102,10 @@ class Configuration:
             raise TypeError("config_string is not a string")
 
         # set dictionaries up to keep the config data
-        self.data = {}
-        self.types = {}
-        self.aliases = {}
-        self.desc = {}
-        for field, info in self.FIELDS:
-            (fdefault, ftype, faliases, fdesc) = info
-            self.data[field] = fdefault
-            self.types[field] = ftype
-            self.desc[field] = fdesc
-            for alias in faliases:
-                self.aliases[alias] = field
+        # NOTE types, aliases and descriptions are shared
+        #      by all the instances of the same class
+        defaults, self.types, self.aliases, self.desc = self._field_maps()
+        self.data = dict(defaults)
 
         if config_string is not None:
             # strip leading/trailing " or ' characters
@@ -127,24 +121,48 @@ class Configuration:
             for key in set(properties.keys()) & set(self.data.keys()):
                 self.data[key] = properties[key]
 
+    @classmethod
+    @functools.cache
+    def _field_maps(cls):
+        """
+        Return a tuple ``(defaults, types, aliases, descriptions)``
+        of dictionaries built from ``FIELDS``,
+        computed once per class.
+
+        :rtype: tuple
+
+        .. versionadded:: 1.7.4
+        """
+        defaults = {}
+        types = {}
+        aliases = {}
+        desc = {}
+        for field, (fdefault, ftype, faliases, fdesc) in cls.FIELDS:
+            defaults[field] = fdefault
+            types[field] = ftype
+            desc[field] = fdesc
+            for alias in faliases:
+                aliases[alias] = field
+        return (defaults, types, aliases, desc)
+
     def __contains__(self, key):
         return (key in self.data) or (key in self.aliases)
 
     def __setitem__(self, key, value):
-        if key in self.aliases:
-            key = self.aliases[key]
+        key = self.aliases.get(key, key)
         if key in self.data:
             self.data[key] = value
         else:
             raise KeyError(key)
 
     def __getitem__(self, key):
-        if key in self.aliases:
-            key = self.aliases[key]
-        if key in self.data:
-            return self._cast(key, self.data[key])
-        else:
-            raise KeyError(key)
+        # NOTE one lookup to resolve the alias, one to read the value
+        key = self.aliases.get(key, key)
+        try:
+            value = self.data[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return self._cast(key, value)
 
     def __str__(self):
         return "\n".join(
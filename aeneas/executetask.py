@@ -554,8 +554,9 @@ class ExecuteTask(Configurable):
         self.synthesizer = Synthesizer(rconf=self.rconf)
 
     def _clear_cache_synthesizer(self):
-        """Clear the cache of the synthesizer"""
+        """Clear the cache of the synthesizer and release its TTS engine"""
         self.synthesizer.clear_cache()
+        self.synthesizer.close()
 
     def _synthesize(self, text_file: TextFile, output_path: str) -> tuple[str, list]:
         """
@@ -167,10 +167,13 @@ def file_extension(path: str | None) -> str | None:
     return ext
 
 
+@functools.lru_cache(maxsize=128)
 def mimetype_from_path(path: str) -> str | None:
     """
     Return a mimetype from the file extension.
 
+    The result is cached, as it only depends on ``path``.
+
     :param string path: the file path
     :rtype: string
     """
@@ -572,6 +575,21 @@ def time_to_ssmmm(time_value: float | None) -> str:
     return f"{time_value:.3f}"
 
 
+def times_to_ssmmm(time_values: typing.Iterable[float | None]) -> list[str]:
+    """
+    Format the given time values into ``SS.mmm`` strings,
+    exactly as :func:`~aeneas.globalfunctions.time_to_ssmmm` would,
+    without a function call per value.
+
+    :param time_values: time values, in seconds
+    :type  time_values: iterable of float
+    :rtype: list of strings
+
+    .. versionadded:: 1.7.4
+    """
+    return [f"{0.0 if value is None else value:.3f}" for value in time_values]
+
+
 def time_from_hhmmssmmm(string: str, decimal_separator: str = ".") -> TimeValue:
     """
     Parse the given ``HH:MM:SS.mmm`` string and return a time value.
@@ -676,10 +694,12 @@ def split_url(url: str | None) -> tuple[str | None, str | None]:
     """
     if url is None:
         return (None, None)
-    array = url.split("#")
-    if len(array) == 1:
-        array.append(None)
-    return tuple(array[0:2])
+    # NOTE partition() does not split the whole string,
+    #      nor does it build an intermediate list
+    base, sep, anchor = url.partition("#")
+    if not sep:
+        return (base, None)
+    return (base, anchor.partition("#")[0])
 
 
 def is_posix() -> bool:
@@ -1052,10 +1072,3 @@ def bundle_directory() -> str | None:
     if FROZEN:
         return sys._MEIPASS
     return None
-
-
-def with_ns(tag: str, ns: str) -> str:
-    """
-    Return tag nam with namespace applied.
-    """
-    return f"{{{ns}}}{tag}"
@@ -745,6 +745,40 @@ class RuntimeConfiguration(Configuration):
     .. versionadded:: 1.6.0
     """
 
+    TTS_CACHE_PATH = "tts_cache_path"
+    """
+    Path to a directory where the audio data synthesized
+    for each distinct text fragment is cached as a file on disk,
+    and kept across runs, for example ``~/.cache/aeneas/tts``.
+
+    Unlike with
+    :data:`~aeneas.runtimeconfiguration.RuntimeConfiguration.TTS_CACHE`,
+    the cache files are not removed after the synthesis is completed,
+    so that aligning the same text again, even partially,
+    does not call the TTS engine for the cached fragments.
+    The least recently used files are removed
+    when the size of the cache exceeds
+    :data:`~aeneas.runtimeconfiguration.RuntimeConfiguration.TTS_CACHE_SIZE`.
+
+    Since the C extensions synthesize all the fragments at once,
+    setting this option disables the C extension of the TTS engine,
+    if the engine can also be called via ``subprocess``.
+
+    Default: ``None``, implying not to use a persistent cache.
+
+    .. versionadded:: 1.7.4
+    """
+
+    TTS_CACHE_SIZE = "tts_cache_size"
+    """
+    Maximum size, in MB, of the persistent TTS cache stored in
+    :data:`~aeneas.runtimeconfiguration.RuntimeConfiguration.TTS_CACHE_PATH`.
+
+    Default: ``100``.
+
+    .. versionadded:: 1.7.4
+    """
+
     TTS_API_SLEEP = "tts_api_sleep"
     """
     Wait this number of seconds before the next HTTP POST request
@@ -1051,6 +1085,14 @@ class RuntimeConfiguration(Configuration):
             ),
         ),
         (TTS_CACHE, (False, bool, [], "if True, cache synthesized audio files")),
+        (
+            TTS_CACHE_PATH,
+            (None, None, [], "path to the persistent TTS cache dir"),
+        ),
+        (
+            TTS_CACHE_SIZE,
+            (100, int, [], "max size of the persistent TTS cache, in MB"),
+        ),
         (TTS_API_SLEEP, ("1.000", TimeValue, [], "sleep between TTS API calls, in s")),
         (
             TTS_API_RETRY_ATTEMPTS,
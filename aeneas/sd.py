@@ -257,10 +257,13 @@ class SD(Configurable):
         with tempfile.NamedTemporaryFile(
             suffix=".wav", dir=self.rconf[RuntimeConfiguration.TMP_PATH]
         ) as tmp_file:
-            synt = Synthesizer(rconf=self.rconf)
-            anchors, total_time, synthesized_chars = synt.synthesize(
-                self.text_file, tmp_file.name, quit_after=synt_duration, backwards=tail
-            )
+            with Synthesizer(rconf=self.rconf) as synt:
+                anchors, total_time, synthesized_chars = synt.synthesize(
+                    self.text_file,
+                    tmp_file.name,
+                    quit_after=synt_duration,
+                    backwards=tail,
+                )
             logger.debug("Synthesizing query... done")
 
             logger.debug("Extracting MFCCs for query...")
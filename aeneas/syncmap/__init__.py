@@ -42,6 +42,7 @@ from aeneas.syncmap.format import SyncMapFormat
 from aeneas.syncmap.fragment import SyncMapFragment, FragmentType
 from aeneas.syncmap.fragmentlist import SyncMapFragmentList
 from aeneas.syncmap.headtailformat import SyncMapHeadTailFormat
+from aeneas.syncmap.smfgxml import SyncMapFormatGenericXML
 from aeneas.tree import Tree
 import aeneas.globalconstants as gc
 import aeneas.globalfunctions as gf
@@ -218,6 +219,8 @@ class SyncMap:
         logger.debug("  Sorting SyncMapFragmentList...")
         result = True
         not_head_tail = [leaf for leaf in leaves if not leaf.is_head_or_tail]
+        # NOTE only a failed sort means inconsistent leaves,
+        #      errors raised by add() are propagated
         for leaf in not_head_tail:
             smf.add(leaf, sort=False)
         try:
@@ -531,6 +534,11 @@ class SyncMap:
 
         # open file for writing
         logger.debug("Writing output file...")
-        with open(output_file_path, "w", encoding="utf-8") as output_file:
-            output_file.write(writer.format(syncmap=pruned_syncmap))
+        if isinstance(writer, SyncMapFormatGenericXML):
+            # NOTE XML documents are streamed to the file as they are serialized
+            with open(output_file_path, "wb") as output_file:
+                writer.format(syncmap=pruned_syncmap, out=output_file)
+        else:
+            with open(output_file_path, "w", encoding="utf-8") as output_file:
+                output_file.write(writer.format(syncmap=pruned_syncmap))
         logger.debug("Writing output file... done")
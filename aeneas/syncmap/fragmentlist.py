@@ -19,11 +19,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import bisect
+import contextlib
 import copy
 import decimal
 import logging
 import typing
 
+import numpy
+
 from aeneas.exacttiming import TimeInterval, TimeValue
 from aeneas.syncmap.fragment import SyncMapFragment, FragmentType
 from aeneas.textfile import TextFragment
@@ -87,6 +90,7 @@ class SyncMapFragmentList:
         self.begin = begin
         self.end = end
         self.__sorted = True
+        self.__deferred = False
         self.__fragments: list[SyncMapFragment] = []
 
     def __len__(self):
@@ -188,6 +192,28 @@ class SyncMapFragmentList:
         """
         return self.__sorted
 
+    @contextlib.contextmanager
+    def deferred_sort(self) -> typing.Iterator["SyncMapFragmentList"]:
+        """
+        Return a context manager for adding many fragments in a row.
+
+        Inside the block, ``add`` behaves as ``add(..., sort=False)``,
+        that is, it just appends the fragment,
+        skipping the overlap check and the sorted insertion.
+        The list is sorted (and checked) once, on exiting the block.
+
+        :raises ValueError: on exit, if there is a fragment which violates
+                            the list constraints
+
+        .. versionadded:: 1.7.4
+        """
+        self.__deferred = True
+        try:
+            yield self
+        finally:
+            self.__deferred = False
+        self.sort()
+
     @property
     def fragments(self) -> typing.Iterator[SyncMapFragment]:
         """
@@ -348,14 +374,15 @@ class SyncMapFragmentList:
 
         :param fragment: the fragment to be added
         :type  fragment: :class:`~aeneas.syncmap.SyncMapFragment`
-        :param bool sort: if ``True`` ensure that after the insertion the list is kept sorted
+        :param bool sort: if ``True`` ensure that after the insertion the list is kept sorted;
+                          ignored inside a ``deferred_sort()`` block
         :raises TypeError: if ``interval`` is not an instance of ``TimeInterval``
         :raises ValueError: if ``interval`` does not respect the boundaries of the list
                             or if it overlaps an existing interval,
                             or if ``sort=True`` but the list is not guaranteed sorted
         """
         self._check_boundaries(fragment)
-        if sort:
+        if sort and not self.__deferred:
             if not self.is_guaranteed_sorted:
                 raise ValueError(
                     "Unable to add with sort=True if the list is not guaranteed sorted"
@@ -408,9 +435,10 @@ class SyncMapFragmentList:
         :param value: the new transition point
         :type  value: :class:`~aeneas.exacttiming.TimeValue`
         """
-        logger.debug("Called move_transition_point with")
-        logger.debug("  fragment_index %d", fragment_index)
-        logger.debug("  value          %.3f", value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Called move_transition_point with")
+            logger.debug("  fragment_index %d", fragment_index)
+            logger.debug("  value          %.3f", value)
         if fragment_index < 0 or fragment_index > (len(self) - 3):
             logger.debug("Bad fragment_index, returning")
             return
@@ -550,26 +578,23 @@ class SyncMapFragmentList:
             self[index].interval.end = nsi.begin
             self[index + 1].interval.begin = nsi.end
         logger.debug("  First pass: making room... done")
-        logger.debug("  Second pass: append nonspeech intervals...")
-        for i, (nsi, index) in enumerate(pairs, 1):
-            identifier = "n%06d" % i
-            self.add(
-                SyncMapFragment(
-                    interval=nsi,
-                    text_fragment=TextFragment(
-                        identifier=identifier,
-                        language=None,
-                        lines=lines,
-                        filtered_lines=lines,
+        logger.debug("  Second pass: append nonspeech intervals and sort...")
+        with self.deferred_sort():
+            for i, (nsi, index) in enumerate(pairs, 1):
+                identifier = "n%06d" % i
+                self.add(
+                    SyncMapFragment(
+                        interval=nsi,
+                        text_fragment=TextFragment(
+                            identifier=identifier,
+                            language=None,
+                            lines=lines,
+                            filtered_lines=lines,
+                        ),
+                        fragment_type=FragmentType.NONSPEECH,
                     ),
-                    fragment_type=FragmentType.NONSPEECH,
-                ),
-                sort=False,
-            )
-        logger.debug("  Second pass: append nonspeech intervals... done")
-        logger.debug("  Third pass: sorting...")
-        self.sort()
-        logger.debug("  Third pass: sorting... done")
+                )
+        logger.debug("  Second pass: append nonspeech intervals and sort... done")
 
     def fix_zero_length_fragments(
         self,
@@ -636,68 +661,83 @@ class SyncMapFragmentList:
                 "Original last was adjacent with next, ending at %.3f",
                 original_last_end,
             )
+        # NOTE the debug messages below are emitted once per fragment,
+        #      so avoid building their arguments if they are not needed
+        debug = logger.isEnabledFor(logging.DEBUG)
         i = min_index
         while i < max_index:
             if self[i].has_zero_length:
-                logger.debug(
-                    "  Fragment %d (%s) has zero length => ENLARGE",
-                    i,
-                    self[i].interval,
-                )
+                if debug:
+                    logger.debug(
+                        "  Fragment %d (%s) has zero length => ENLARGE",
+                        i,
+                        self[i].interval,
+                    )
                 moves: list[tuple[int, str, TimeValue | None]] = [
                     (i, "ENLARGE", duration)
                 ]
                 slack = duration
                 j = i + 1
-                logger.debug("  Entered while with j == %d", j)
+                if debug:
+                    logger.debug("  Entered while with j == %d", j)
                 while (j < max_index) and (self[j].interval.length < slack):
                     if self[j].has_zero_length:
-                        logger.debug(
-                            "  Fragment %d (%s) has zero length => ENLARGE",
-                            j,
-                            self[j].interval,
-                        )
+                        if debug:
+                            logger.debug(
+                                "  Fragment %d (%s) has zero length => ENLARGE",
+                                j,
+                                self[j].interval,
+                            )
                         moves.append((j, "ENLARGE", duration))
                         slack += duration
                     else:
-                        logger.debug(
-                            "  Fragment %d (%s) has non zero length => MOVE",
-                            j,
-                            self[j].interval,
-                        )
+                        if debug:
+                            logger.debug(
+                                "  Fragment %d (%s) has non zero length => MOVE",
+                                j,
+                                self[j].interval,
+                            )
                         moves.append((j, "MOVE", None))
                     j += 1
-                logger.debug("  Exited while with j == %d", j)
+                if debug:
+                    logger.debug("  Exited while with j == %d", j)
                 fixable = False
                 if (j == max_index) and (self[j - 1].interval.end + slack <= self.end):
-                    logger.debug("  Fixable by moving back")
+                    if debug:
+                        logger.debug("  Fixable by moving back")
                     current_time = self[j - 1].interval.end + slack
                     fixable = True
                 elif j < max_index:
-                    logger.debug("  Fixable by shrinking")
+                    if debug:
+                        logger.debug("  Fixable by shrinking")
                     self[j].interval.shrink(slack)
                     current_time = self[j].interval.begin
                     fixable = True
                 if fixable:
                     for index, move_type, move_amount in moves[::-1]:
-                        logger.debug(
-                            "    Calling move_end_at with %.3f at index %d",
-                            current_time,
-                            index,
-                        )
+                        if debug:
+                            logger.debug(
+                                "    Calling move_end_at with %.3f at index %d",
+                                current_time,
+                                index,
+                            )
                         self[index].interval.move_end_at(current_time)
                         if move_type == "ENLARGE":
+                            if debug:
+                                logger.debug(
+                                    "    Calling enlarge with %.3f at index %d",
+                                    move_amount,
+                                    index,
+                                )
+                            self[index].interval.enlarge(move_amount)
+                        if debug:
                             logger.debug(
-                                "    Calling enlarge with %.3f at index %d",
-                                move_amount,
+                                "    Interval %d is now: %s",
                                 index,
+                                self[index].interval,
                             )
-                            self[index].interval.enlarge(move_amount)
-                        logger.debug(
-                            "    Interval %d is now: %s", index, self[index].interval
-                        )
                         current_time = self[index].interval.begin
-                else:
+                elif debug:
                     logger.debug("Unable to fix fragment %d (%s)", i, self[i].interval)
                 i = j - 1
             i += 1
@@ -713,77 +753,111 @@ class SyncMapFragmentList:
                 logger.debug("  Original was %.3f", original_last_end)
                 logger.debug("  New      is  %.3f", self[max_index].begin)
                 self[max_index].begin = self[max_index - 1].end
-        logger.debug("Fragments after fixing:")
-        for i, fragment in enumerate(self):
-            logger.debug(
-                "  %d => %.3f %.3f", i, fragment.interval.begin, fragment.interval.end
-            )
+        if debug:
+            logger.debug("Fragments after fixing:")
+            for i, fragment in enumerate(self):
+                logger.debug(
+                    "  %d => %.3f %.3f",
+                    i,
+                    fragment.interval.begin,
+                    fragment.interval.end,
+                )
+
+    def fragments_faster_than(self, rate: decimal.Decimal) -> list[int]:
+        """
+        Return the indices of the ``REGULAR`` fragments
+        whose rate is greater than or equal to the given ``rate``.
+
+        The fragments are screened all at once with NumPy,
+        and only the candidates are checked with the exact
+        (``Decimal``) rate.
+
+        :param rate: the rate (characters/second)
+        :type  rate: :class:`~decimal.Decimal`
+        :rtype: list of int
+
+        .. versionadded:: 1.7.4
+        """
+        regular = list(self.regular_fragments)
+        count = len(regular)
+        chars = numpy.fromiter((f.chars for i, f in regular), numpy.float64, count)
+        lengths = numpy.fromiter((f.length for i, f in regular), numpy.float64, count)
+        # NOTE the float comparison has a small margin,
+        #      so that it cannot discard a fragment because of rounding
+        candidates = numpy.flatnonzero(
+            (lengths > 0) & (chars >= lengths * float(rate) * (1 - 1e-9))
+        )
+        faster = []
+        for k in candidates:
+            i, fragment = regular[k]
+            fragment_rate = fragment.rate
+            if fragment_rate is not None and fragment_rate >= rate:
+                faster.append(i)
+        return faster
 
     def fix_fragment_rate(
         self, fragment_index: int, max_rate: decimal.Decimal, aggressive: bool = False
     ):
+        debug = logger.isEnabledFor(logging.DEBUG)
+        n = len(self)
+
         def fix_pair(current_index, donor_index):
-            logger.debug("Called fix_pair")
-            if (
-                current_index < 0
-                or current_index >= len(self)
-                or donor_index < 0
-                or donor_index >= len(self)
-                or abs(current_index - donor_index) > 1
+            if debug:
+                logger.debug("Called fix_pair")
+            if not (
+                0 <= current_index < n
+                and 0 <= donor_index < n
+                and abs(current_index - donor_index) == 1
             ):
-                logger.debug("Invalid index, returning False")
+                if debug:
+                    logger.debug("Invalid index, returning False")
                 return False
-            donor_is_previous = donor_index < current_index
+            donor_is_previous = donor_index == current_index - 1
             current_fragment = self[current_index]
             donor_fragment = self[donor_index]
-            if (current_fragment.rate is not None) and (
-                current_fragment.rate <= max_rate
-            ):
-                logger.debug(
-                    "Current fragment rate is already <= max_rate, returning True"
-                )
-                return True
-            if donor_is_previous:
-                if not donor_fragment.interval.is_non_zero_before_non_zero(
-                    current_fragment.interval
-                ):
+            current_rate = current_fragment.rate
+            if (current_rate is not None) and (current_rate <= max_rate):
+                if debug:
                     logger.debug(
-                        "donor fragment is not adjacent before current fragment, returning False"
+                        "Current fragment rate is already <= max_rate, returning True"
                     )
-                    return False
-            else:
-                if not current_fragment.interval.is_non_zero_before_non_zero(
-                    donor_fragment.interval
-                ):
+                return True
+            left_index, left, right = (
+                (donor_index, donor_fragment, current_fragment)
+                if donor_is_previous
+                else (current_index, current_fragment, donor_fragment)
+            )
+            if not left.interval.is_non_zero_before_non_zero(right.interval):
+                if debug:
                     logger.debug(
-                        "current fragment is not adjacent before donor fragment, returning False"
+                        "Current and donor fragments are not adjacent, returning False"
                     )
-                    return False
+                return False
 
-            logger.debug("Current and donor fragments are adjacent and not zero length")
             current_lack = current_fragment.rate_lack(max_rate)
             donor_slack = donor_fragment.rate_slack(max_rate)
-            logger.debug("Current lack %.3f", current_lack)
-            logger.debug("Donor  slack %.3f", donor_slack)
+            if debug:
+                logger.debug(
+                    "Current and donor fragments are adjacent and not zero length"
+                )
+                logger.debug("Current lack %.3f", current_lack)
+                logger.debug("Donor  slack %.3f", donor_slack)
             if donor_slack <= 0:
-                logger.debug("Donor has no slack, returning False")
+                if debug:
+                    logger.debug("Donor has no slack, returning False")
                 return False
-            logger.debug("Donor has some slack")
             effective_slack = min(current_lack, donor_slack)
-            if donor_is_previous:
-                self.move_transition_point(
-                    donor_index, donor_fragment.end - effective_slack
-                )
-            else:
-                self.move_transition_point(
-                    current_index, current_fragment.end + effective_slack
+            # move the transition point between left and right
+            # towards the donor fragment
+            shift = -effective_slack if donor_is_previous else effective_slack
+            self.move_transition_point(left_index, left.end + shift)
+            fully_stolen = effective_slack == current_lack
+            if debug:
+                logger.debug(
+                    "Current lack can be %s stolen from donor",
+                    "fully" if fully_stolen else "partially",
                 )
-            if effective_slack == current_lack:
-                logger.debug("Current lack can be fully stolen from donor")
-                return True
-            else:
-                logger.debug("Current lack can be partially stolen from donor")
-                return False
+            return fully_stolen
 
         # try fixing rate stealing slack from the previous fragment
         if fix_pair(fragment_index, fragment_index - 1):
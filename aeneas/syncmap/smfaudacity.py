@@ -29,6 +29,8 @@ class SyncMapFormatAudacity(SyncMapFormatGenericTabular):
     Handler for Audacity I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "aud"
 
     HUMAN = "audh"
@@ -37,6 +37,8 @@ class SyncMapFormatBase(abc.ABC):
     Base class for I/O handlers.
     """
 
+    __slots__ = ("variant", "parameters")
+
     def __init__(
         self,
         variant: str | None = None,
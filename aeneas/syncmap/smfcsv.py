@@ -29,6 +29,8 @@ class SyncMapFormatCSV(SyncMapFormatGenericTabular):
     Handler for comma-separated values (CSV) I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "csv"
 
     HUMAN = "csvh"
@@ -20,104 +20,195 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
+
+import lxml.etree as ET
 
 from aeneas.syncmap.smfgxml import SyncMapFormatGenericXML
 import aeneas.globalconstants as gc
 import aeneas.globalfunctions as gf
 
+_XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+_EAF_NSMAP = {"xsi": _XSI_NS}
+_XSI_SCHEMA_LOCATION = f"{{{_XSI_NS}}}noNamespaceSchemaLocation"
+_EAF_SCHEMA_URL = "http://www.mpi.nl/tools/elan/EAFv2.8.xsd"
+
+_ELEMENTS_XPATH = ET.XPath("//TIME_SLOT | //ALIGNABLE_ANNOTATION")
+
 
 class SyncMapFormatEAF(SyncMapFormatGenericXML):
     """
     Handler for ELAN I/O format (EAF).
     """
 
+    __slots__ = ()
+
     DEFAULT = "eaf"
 
     def parse(self, input_text, syncmap):
-        from lxml import etree
-
-        # get root
-        root = etree.fromstring(gf.safe_bytes(input_text))
-        # get time slots
-        time_slots = dict()
-        for ts in root.iter("TIME_SLOT"):
-            time_slots[ts.get("TIME_SLOT_ID")] = (
-                gf.time_from_ssmmm(ts.get("TIME_VALUE")) / 1000
+        data = gf.safe_bytes(input_text)
+        if len(data) < self.STREAMING_THRESHOLD:
+            elements = self._query_elements(data)
+        else:
+            elements = self._stream_elements(
+                data, ("TIME_SLOT", "ALIGNABLE_ANNOTATION")
             )
-        # parse annotations
-        for alignable in root.iter("ALIGNABLE_ANNOTATION"):
-            identifier = gf.safe_unicode(alignable.get("ANNOTATION_ID"))
-            begin = time_slots[alignable.get("TIME_SLOT_REF1")]
-            end = time_slots[alignable.get("TIME_SLOT_REF2")]
-            lines = []
-            for value in alignable.iter("ANNOTATION_VALUE"):
-                lines.append(gf.safe_unicode(value.text))
-            self._add_fragment(
+        time_from_ssmmm = gf.time_from_ssmmm
+        safe_unicode = gf.safe_unicode
+        time_slots = dict()
+        annotations = []
+        append = annotations.append
+        for elem in elements:
+            if elem.tag == "TIME_SLOT":
+                # get time slots
+                time_slots[elem.get("TIME_SLOT_ID")] = (
+                    time_from_ssmmm(elem.get("TIME_VALUE")) / 1000
+                )
+            else:
+                # get annotations
+                append(
+                    (
+                        safe_unicode(elem.get("ANNOTATION_ID")),
+                        elem.get("TIME_SLOT_REF1"),
+                        elem.get("TIME_SLOT_REF2"),
+                        [
+                            safe_unicode(value.text)
+                            for value in elem.iter("ANNOTATION_VALUE")
+                        ],
+                    )
+                )
+        # NOTE time slots are resolved at the end,
+        #      so that they can appear anywhere in the document
+        add_fragment = self._add_fragment
+        for identifier, begin_ref, end_ref, lines in annotations:
+            add_fragment(
                 syncmap=syncmap,
                 identifier=identifier,
                 lines=lines,
-                begin=begin,
-                end=end,
+                begin=time_slots[begin_ref],
+                end=time_slots[end_ref],
             )
 
-    def format(self, syncmap):
-        from lxml import etree
+    @staticmethod
+    def _query_elements(data):
+        """
+        Load the whole document and select the time slots
+        and the annotations with a precompiled XPath query.
 
-        # namespaces
-        xsi = "http://www.w3.org/2001/XMLSchema-instance"
-        ns_map = {"xsi": xsi}
-        # build doc
-        doc = etree.Element("ANNOTATION_DOCUMENT", nsmap=ns_map)
-        doc.attrib["{%s}noNamespaceSchemaLocation" % xsi] = (
-            "http://www.mpi.nl/tools/elan/EAFv2.8.xsd"
-        )
-        doc.attrib["AUTHOR"] = "aeneas"
-        doc.attrib["DATE"] = gf.datetime_string(time_zone=True)
-        doc.attrib["FORMAT"] = "2.8"
-        doc.attrib["VERSION"] = "2.8"
-        # header
-        header = etree.SubElement(doc, "HEADER")
-        header.attrib["MEDIA_FILE"] = ""
-        header.attrib["TIME_UNITS"] = "milliseconds"
-        if (
-            (self.parameters is not None)
-            and (gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF in self.parameters)
-            and (self.parameters[gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF] is not None)
-        ):
-            media = etree.SubElement(header, "MEDIA_DESCRIPTOR")
-            media.attrib["MEDIA_URL"] = self.parameters[
-                gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF
-            ]
-            media.attrib["MIME_TYPE"] = gf.mimetype_from_path(
-                self.parameters[gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF]
-            )
-        # time order
-        time_order = etree.SubElement(doc, "TIME_ORDER")
-        # tier
-        tier = etree.SubElement(doc, "TIER")
-        tier.attrib["LINGUISTIC_TYPE_REF"] = "utterance"
-        tier.attrib["TIER_ID"] = "tier1"
-        for i, fragment in enumerate(syncmap.fragments, 1):
-            # time slots
-            begin_id = "ts%06db" % i
-            end_id = "ts%06de" % i
-            slot = etree.SubElement(time_order, "TIME_SLOT")
-            slot.attrib["TIME_SLOT_ID"] = begin_id
-            slot.attrib["TIME_VALUE"] = "%d" % (fragment.begin * 1000)
-            slot = etree.SubElement(time_order, "TIME_SLOT")
-            slot.attrib["TIME_SLOT_ID"] = end_id
-            slot.attrib["TIME_VALUE"] = "%d" % (fragment.end * 1000)
-            # annotation
-            annotation = etree.SubElement(tier, "ANNOTATION")
-            alignable = etree.SubElement(annotation, "ALIGNABLE_ANNOTATION")
-            alignable.attrib["ANNOTATION_ID"] = fragment.text_fragment.identifier
-            alignable.attrib["TIME_SLOT_REF1"] = begin_id
-            alignable.attrib["TIME_SLOT_REF2"] = end_id
-            value = etree.SubElement(alignable, "ANNOTATION_VALUE")
-            value.text = " ".join(fragment.text_fragment.lines)
-        # linguistic type
-        ling = etree.SubElement(doc, "LINGUISTIC_TYPE")
-        ling.attrib["LINGUISTIC_TYPE_ID"] = "utterance"
-        ling.attrib["TIME_ALIGNABLE"] = "true"
-        # write tree
-        return self._tree_to_string(doc)
+        :param bytes data: the EAF document
+        :rtype: list of ``lxml.etree._Element``
+        """
+        return _ELEMENTS_XPATH(ET.fromstring(data))
+
+    def format(self, syncmap, out=None):
+        # NOTE the document is streamed with an incremental writer
+        #      instead of building the whole tree in memory;
+        #      the whitespace is written explicitly, so that the output
+        #      is the same as the one of a pretty printed tree
+        fragments = syncmap.fragments
+        output = io.BytesIO() if out is None else out
+        with ET.xmlfile(output, encoding="UTF-8") as xml_file:
+            xml_file.write_declaration()
+            doc_attrib = {
+                _XSI_SCHEMA_LOCATION: _EAF_SCHEMA_URL,
+                "AUTHOR": "aeneas",
+                "DATE": gf.datetime_string(time_zone=True),
+                "FORMAT": "2.8",
+                "VERSION": "2.8",
+            }
+            with xml_file.element("ANNOTATION_DOCUMENT", doc_attrib, nsmap=_EAF_NSMAP):
+                # header
+                header = ET.Element(
+                    "HEADER", {"MEDIA_FILE": "", "TIME_UNITS": "milliseconds"}
+                )
+                if (
+                    (self.parameters is not None)
+                    and (gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF in self.parameters)
+                    and (self.parameters[gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF] is not None)
+                ):
+                    header.text = "\n    "
+                    audio_ref = self.parameters[gc.PPN_TASK_OS_FILE_EAF_AUDIO_REF]
+                    media = ET.SubElement(
+                        header,
+                        "MEDIA_DESCRIPTOR",
+                        {
+                            "MEDIA_URL": audio_ref,
+                            "MIME_TYPE": gf.mimetype_from_path(audio_ref),
+                        },
+                    )
+                    media.tail = "\n  "
+                xml_file.write("\n  ", header)
+                # time order
+                xml_file.write("\n  ")
+                if fragments:
+                    with xml_file.element("TIME_ORDER"):
+                        end = end_ms = None
+                        for i, fragment in enumerate(fragments, 1):
+                            # time slots, in integer milliseconds
+                            # NOTE fragments are usually adjacent, so reuse
+                            #      the end string of the previous fragment
+                            begin = fragment.begin
+                            begin_ms = (
+                                end_ms if begin == end else str(int(begin * 1000))
+                            )
+                            end = fragment.end
+                            end_ms = str(int(end * 1000))
+                            xml_file.write(
+                                "\n    ",
+                                ET.Element(
+                                    "TIME_SLOT",
+                                    {
+                                        "TIME_SLOT_ID": f"ts{i:06d}b",
+                                        "TIME_VALUE": begin_ms,
+                                    },
+                                ),
+                                "\n    ",
+                                ET.Element(
+                                    "TIME_SLOT",
+                                    {
+                                        "TIME_SLOT_ID": f"ts{i:06d}e",
+                                        "TIME_VALUE": end_ms,
+                                    },
+                                ),
+                            )
+                        xml_file.write("\n  ")
+                else:
+                    xml_file.write(ET.Element("TIME_ORDER"))
+                # tier
+                xml_file.write("\n  ")
+                tier_attrib = {"LINGUISTIC_TYPE_REF": "utterance", "TIER_ID": "tier1"}
+                if fragments:
+                    with xml_file.element("TIER", tier_attrib):
+                        for i, fragment in enumerate(fragments, 1):
+                            text_fragment = fragment.text_fragment
+                            # annotation
+                            annotation = ET.Element("ANNOTATION")
+                            annotation.text = "\n      "
+                            alignable = ET.SubElement(
+                                annotation,
+                                "ALIGNABLE_ANNOTATION",
+                                {
+                                    "ANNOTATION_ID": text_fragment.identifier,
+                                    "TIME_SLOT_REF1": f"ts{i:06d}b",
+                                    "TIME_SLOT_REF2": f"ts{i:06d}e",
+                                },
+                            )
+                            alignable.text = "\n        "
+                            alignable.tail = "\n    "
+                            value = ET.SubElement(alignable, "ANNOTATION_VALUE")
+                            value.text = " ".join(text_fragment.lines)
+                            value.tail = "\n      "
+                            xml_file.write("\n    ", annotation)
+                        xml_file.write("\n  ")
+                else:
+                    xml_file.write(ET.Element("TIER", tier_attrib))
+                # linguistic type
+                ling = ET.Element(
+                    "LINGUISTIC_TYPE",
+                    {"LINGUISTIC_TYPE_ID": "utterance", "TIME_ALIGNABLE": "true"},
+                )
+                xml_file.write("\n  ", ling, "\n")
+        output.write(b"\n")
+        if out is None:
+            return output.getvalue().decode("utf-8")
+        return None
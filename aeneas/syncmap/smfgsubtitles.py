@@ -28,6 +28,18 @@ class SyncMapFormatGenericSubtitles(SyncMapFormatBase):
     Base class for subtitles-like I/O format handlers.
     """
 
+    __slots__ = (
+        "header_string",
+        "header_might_not_have_trailing_blank_line",
+        "footer_string",
+        "cue_has_identifier",
+        "cue_has_optional_identifier",
+        "time_values_separator",
+        "line_break_symbol",
+        "parse_time_function",
+        "format_time_function",
+    )
+
     DEFAULT = "subtitles"
     """
     The code for the default variant
@@ -129,9 +141,11 @@ class SyncMapFormatGenericSubtitles(SyncMapFormatBase):
             begin, end = split[0:2]
             begin = begin.strip()
             end = ((end.strip()).split(" "))[0]
-            begin = self.parse_time_function(begin)
-            end = self.parse_time_function(end)
-            return (begin, end)
+            return (parse_time(begin), parse_time(end))
+
+        # NOTE bind the callables used in the loop to locals
+        parse_time = self.parse_time_function
+        add_fragment = self._add_fragment
 
         input_lines = [line.strip() for line in input_text.splitlines()]
         i = 0
@@ -185,7 +199,7 @@ class SyncMapFormatGenericSubtitles(SyncMapFormatBase):
                 lines = ("\n".join(acc[j:])).split(self.line_break_symbol)
 
                 # append fragment
-                self._add_fragment(
+                add_fragment(
                     syncmap=syncmap,
                     identifier=identifier,
                     lines=lines,
@@ -201,20 +215,22 @@ class SyncMapFormatGenericSubtitles(SyncMapFormatBase):
         if self.header_string is not None:
             msg.append(self.header_string)
             msg.append("")
+        # NOTE bind the attributes used in the loop to locals
+        append = msg.append
+        format_time = self.format_time_function
+        time_values_separator = self.time_values_separator
+        line_break_symbol = self.line_break_symbol
+        has_identifier = self.cue_has_identifier or self.cue_has_optional_identifier
         for i, fragment in enumerate(syncmap.fragments, 1):
-            text = fragment.text_fragment
-            if self.cue_has_identifier or self.cue_has_optional_identifier:
-                msg.append("%d" % i)
-            msg.append(
-                "{}{}{}".format(
-                    self.format_time_function(fragment.begin),
-                    self.time_values_separator,
-                    self.format_time_function(fragment.end),
-                )
+            if has_identifier:
+                append("%d" % i)
+            append(
+                f"{format_time(fragment.begin)}"
+                f"{time_values_separator}"
+                f"{format_time(fragment.end)}"
             )
-            lines = self.line_break_symbol.join(text.lines)
-            msg.append(lines)
-            msg.append("")
+            append(line_break_symbol.join(fragment.text_fragment.lines))
+            append("")
         if self.footer_string is not None:
             msg.append(self.footer_string)
         else:
@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+import operator
 import typing
 
 from aeneas.syncmap.smfbase import SyncMapFormatBase
@@ -36,6 +38,8 @@ class SyncMapFormatGenericTabular(SyncMapFormatBase):
     Base class for tabular-like I/O format handlers.
     """
 
+    __slots__ = ("parse_time_function", "format_time_function")
+
     DEFAULT = "tabular"
     """
     The code for the default variant
@@ -82,6 +86,17 @@ class SyncMapFormatGenericTabular(SyncMapFormatBase):
     Otherwise, use the specified character.
     """
 
+    ROW_FIELDS: typing.ClassVar[tuple[str, ...]] = (
+        "identifier",
+        "begin",
+        "end",
+        "text",
+    )
+    """
+    The order of the arguments of the row function used by ``format``,
+    which outputs the fields listed in ``FIELDS``.
+    """
+
     def __init__(self, variant=DEFAULT, parameters=None):
         super().__init__(variant=variant, parameters=parameters)
         # store parse/format time functions
@@ -91,49 +106,72 @@ class SyncMapFormatGenericTabular(SyncMapFormatBase):
         else:
             self.parse_time_function = gf.time_from_hhmmssmmm
             self.format_time_function = gf.time_to_hhmmssmmm
-        # create write template string
-        placeholders = [None for i in range(len(self.FIELDS))]
-        for k in self.FIELDS:
-            placeholders[self.FIELDS[k]] = k
-        self.write_template = self.FIELD_DELIMITER.join(
-            ["{%s}" % p for p in placeholders]
-        )
+
+    @classmethod
+    @functools.cache
+    def _row_function(cls) -> typing.Callable[..., str]:
+        """
+        Return a function building the output row of a fragment
+        from its identifier, begin, end and text
+        (positional arguments, in the ``ROW_FIELDS`` order).
+
+        Since it only depends on the class constants,
+        it is built once per class.
+        """
+        placeholders = [None] * len(cls.FIELDS)
+        for k, v in cls.FIELDS.items():
+            placeholders[v] = k
+        pick = operator.itemgetter(*[cls.ROW_FIELDS.index(p) for p in placeholders])
+        join = cls.FIELD_DELIMITER.join
+        text_delimiter = cls.TEXT_DELIMITER
+
+        def row(identifier, begin, end, text):
+            if text_delimiter is not None:
+                text = f"{text_delimiter}{text}{text_delimiter}"
+            return join(pick((identifier, begin, end, text)))
+
+        return row
 
     def parse(self, input_text, syncmap):
-        lines = []
-        for line in input_text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            lines.append(line)
+        lines = filter(None, map(str.strip, input_text.splitlines()))
+
+        # NOTE bind the values used in the loop to locals
+        parse_time = self.parse_time_function
+        add_fragment = self._add_fragment
+        field_delimiter = self.FIELD_DELIMITER
+        text_delimiter = self.TEXT_DELIMITER
+        identifier_index = self.FIELDS.get("identifier")
+        begin_index = self.FIELDS["begin"]
+        end_index = self.FIELDS["end"]
+        text_index = self.FIELDS.get("text")
 
         for index, line in enumerate(lines, start=1):
-            split = line.split(self.FIELD_DELIMITER)
+            split = line.split(field_delimiter)
 
             # set identifier
-            if "identifier" in self.FIELDS:
-                identifier = split[self.FIELDS["identifier"]]
+            if identifier_index is not None:
+                identifier = split[identifier_index]
             else:
                 identifier = "f%06d" % index
 
             # set begin and end
-            begin = self.parse_time_function(split[self.FIELDS["begin"]])
-            end = self.parse_time_function(split[self.FIELDS["end"]])
+            begin = parse_time(split[begin_index])
+            end = parse_time(split[end_index])
 
             # set text
-            if "text" in self.FIELDS:
-                text = self.FIELD_DELIMITER.join(split[self.FIELDS["text"] :])
+            if text_index is not None:
+                text = field_delimiter.join(split[text_index:])
                 if (
-                    (self.TEXT_DELIMITER is not None)
+                    (text_delimiter is not None)
                     and (len(text) > 1)
-                    and (text[0] == self.TEXT_DELIMITER)
-                    and (text[-1] == self.TEXT_DELIMITER)
+                    and (text[0] == text_delimiter)
+                    and (text[-1] == text_delimiter)
                 ):
                     text = text[1:-1]
             else:
                 text = ""
 
-            self._add_fragment(
+            add_fragment(
                 syncmap=syncmap,
                 identifier=identifier,
                 lines=[text],
@@ -142,21 +180,12 @@ class SyncMapFormatGenericTabular(SyncMapFormatBase):
             )
 
     def format(self, syncmap):
-        msg = []
-        for fragment in syncmap.fragments:
-            # get identifier
-            identifier = fragment.text_fragment.identifier
-            # get begin and end
-            begin = self.format_time_function(fragment.begin)
-            end = self.format_time_function(fragment.end)
-            # get text
-            text = fragment.text_fragment.text
-            if self.TEXT_DELIMITER is not None:
-                text = f"{self.TEXT_DELIMITER}{text}{self.TEXT_DELIMITER}"
-            # format string
-            msg.append(
-                self.write_template.format(
-                    identifier=identifier, begin=begin, end=end, text=text
-                )
-            )
-        return "\n".join(msg)
+        fragments = syncmap.fragments
+        format_time = self.format_time_function
+        # NOTE compute each column for all the fragments at once,
+        #      then build the rows with a single map() call
+        identifiers = map(operator.attrgetter("text_fragment.identifier"), fragments)
+        begins = map(format_time, map(operator.attrgetter("begin"), fragments))
+        ends = map(format_time, map(operator.attrgetter("end"), fragments))
+        texts = map(operator.attrgetter("text_fragment.text"), fragments)
+        return "\n".join(map(self._row_function(), identifiers, begins, ends, texts))
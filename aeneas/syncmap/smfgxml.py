@@ -20,12 +20,17 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from itertools import chain
+import abc
+import contextlib
+import io
+import typing
 
 import lxml.etree as ET
 
 from aeneas.syncmap.smfbase import SyncMapFormatBase
-import aeneas.globalfunctions as gf
+
+if typing.TYPE_CHECKING:
+    from aeneas.syncmap import SyncMap
 
 
 class SyncMapFormatGenericXML(SyncMapFormatBase):
@@ -33,12 +38,45 @@ class SyncMapFormatGenericXML(SyncMapFormatBase):
     Base class for XML-like I/O format handlers.
     """
 
+    __slots__ = ()
+
     DEFAULT = "genericxml"
     """
     The code for the default variant
     associated with this format.
     """
 
+    INDENT = "  "
+    """
+    The indentation of each level of the serialized tree.
+    """
+
+    XML_NS = "http://www.w3.org/XML/1998/namespace"
+    """
+    The (implicitly declared) namespace of the ``xml`` prefix.
+    """
+
+    STREAMING_THRESHOLD = 1024 * 1024
+    """
+    Documents at least this long are streamed with ``iterparse``
+    while parsing, smaller ones are loaded in memory.
+
+    .. versionadded:: 1.7.4
+    """
+
+    @abc.abstractmethod
+    def format(self, syncmap: "SyncMap", out=None) -> str | None:
+        """
+        Format the given ``syncmap`` as a string.
+
+        If the binary file object ``out`` is given,
+        the document is written to it as it is serialized,
+        and ``None`` is returned.
+
+        .. versionadded:: 1.7.4
+           The ``out`` parameter.
+        """
+
     @classmethod
     def _get_lines_from_node_text(cls, node):
         """
@@ -47,37 +85,149 @@ class SyncMapFormatGenericXML(SyncMapFormatBase):
         """
         # TODO more robust parsing
 
-        parts = (
-            [node.text]
-            + list(
-                chain(
-                    *(
-                        [ET.tostring(c, with_tail=False), c.tail]
-                        for c in node.getchildren()
-                    )
-                )
-            )
-            + [node.tail]
-        )
-        parts = [gf.safe_unicode(p) for p in parts]
-        parts = [p.strip() for p in parts if not p.startswith("<br ")]
-        parts = [p for p in parts if len(p) > 0]
-        uparts = []
-        for part in parts:
-            uparts.append(gf.safe_unicode(part))
-        return uparts
+        def parts():
+            yield node.text
+            for child in node.iterchildren():
+                # NOTE <br/> children (in any namespace) are line separators,
+                #      any other child is kept serialized
+                if not (
+                    isinstance(child.tag, str) and ET.QName(child).localname == "br"
+                ):
+                    yield ET.tostring(child, encoding=str, with_tail=False)
+                yield child.tail
+            yield node.tail
+
+        # NOTE lxml returns text and tails as str already
+        return [part for part in (p.strip() for p in parts() if p) if part]
+
+    @staticmethod
+    def _stream_elements(data: bytes, tag):
+        """
+        Yield the elements with the given tag(s) while streaming the document,
+        clearing each element (and its preceding siblings)
+        as soon as it has been processed.
+
+        :param bytes data: the XML document
+        :param tag: the tag, or the tuple of tags, of the elements to yield
+        :rtype: generator of ``lxml.etree._Element``
+        """
+        for _, elem in ET.iterparse(io.BytesIO(data), events=("end",), tag=tag):
+            yield elem
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    @classmethod
+    def _indent(cls, element, level: int = 0) -> None:
+        """
+        Set the whitespace of the subtree rooted at ``element``,
+        located at the given depth of the document,
+        as ``pretty_print`` would output it.
+
+        As libxml2 does, elements with mixed content are left untouched.
+        """
+        if len(element) == 0 or element.text or any(child.tail for child in element):
+            return
+        indentation = "\n" + cls.INDENT * (level + 1)
+        element.text = indentation
+        for child in element:
+            cls._indent(child, level + 1)
+            child.tail = indentation
+        child.tail = "\n" + cls.INDENT * level
+
+    @classmethod
+    def _write_subtree(cls, xml_file, element, level: int) -> None:
+        """
+        Write a detached element to the incremental writer ``xml_file``,
+        indented as it would be at the given depth of the document.
+
+        Since the element is serialized on its own,
+        any namespace it uses would be declared again:
+        elements of the default namespace of the document
+        should be created without namespace.
+        """
+        cls._indent(element, level)
+        xml_file.write("\n" + cls.INDENT * level, element)
+
+    @classmethod
+    @contextlib.contextmanager
+    def _element(
+        cls, xml_file, level: int, tag, attrib=None, *, nsmap=None, empty=False
+    ):
+        """
+        Context manager writing the start and the end tags
+        of an element to the incremental writer ``xml_file``,
+        indented as they would be at the given depth of the document.
+
+        If ``empty`` is ``True``, the end tag immediately follows the start tag.
+        """
+        xml_prefix = f"{{{cls.XML_NS}}}"
+        if attrib and any(key.startswith(xml_prefix) for key in attrib):
+            # NOTE the incremental writer does not know the xml prefix,
+            #      and it would declare a new one for its namespace
+            # NOTE "{" can only start a qualified name, so this
+            #      replaces the namespace of xml attributes only
+            attrib = {
+                key.replace(xml_prefix, "xml:", 1): value
+                for key, value in attrib.items()
+            }
+        if level > 0:
+            xml_file.write("\n" + cls.INDENT * level)
+        with xml_file.element(tag, attrib, nsmap=nsmap):
+            yield
+            if not empty:
+                xml_file.write("\n" + cls.INDENT * level)
 
     @classmethod
-    def _tree_to_string(
-        cls, root_element, *, xml_declaration: bool = True, pretty_print: bool = True
-    ) -> str:
+    def _stream_tree(
+        cls,
+        root_element,
+        write_children=None,
+        *,
+        xml_declaration: bool = True,
+        out=None,
+    ) -> str | None:
         """
-        Return an ``lxml`` tree serialized as a string.
+        Return an ``lxml`` tree serialized as a pretty printed string,
+        preceded by the XML declaration if ``xml_declaration`` is ``True``,
+        streaming the children of its innermost element
+        instead of building them in memory.
+        If the binary file object ``out`` is given,
+        the tree is written to it instead, and ``None`` is returned.
+
+        ``root_element`` must be a chain of elements,
+        each one with at most one child.
+        The children of the last element of the chain
+        are written by ``write_children``,
+        called with the incremental writer and their depth.
+        If ``write_children`` is ``None``, the tree is written as it is.
         """
-        return ET.tostring(
-            root_element,
-            encoding="UTF-8",
-            method="xml",
-            xml_declaration=xml_declaration,
-            pretty_print=pretty_print,
-        ).decode("utf-8")
+
+        def write_chain(xml_file, element, level):
+            # NOTE only the root element declares namespaces
+            with cls._element(
+                xml_file,
+                level,
+                element.tag,
+                element.attrib,
+                nsmap=(element.nsmap or None) if level == 0 else None,
+            ):
+                if len(element) > 0:
+                    write_chain(xml_file, element[0], level + 1)
+                else:
+                    write_children(xml_file, level + 1)
+
+        output = io.BytesIO() if out is None else out
+        with ET.xmlfile(output, encoding="UTF-8") as xml_file:
+            if xml_declaration:
+                xml_file.write_declaration()
+            if write_children is None:
+                cls._indent(root_element)
+                xml_file.write(root_element)
+            else:
+                write_chain(xml_file, root_element, 0)
+        # NOTE pretty_print ends the document with a new line
+        output.write(b"\n")
+        if out is None:
+            return output.getvalue().decode("utf-8")
+        return None
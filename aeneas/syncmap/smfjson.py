@@ -31,6 +31,8 @@ class SyncMapFormatJSON(SyncMapFormatBase):
     Handler for JSON I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "json"
 
     def parse(self, input_text, syncmap):
@@ -33,6 +33,8 @@ class SyncMapFormatRBSE(SyncMapFormatBase):
     I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "rbse"
 
     def parse(self, input_text, syncmap):
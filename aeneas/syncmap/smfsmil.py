@@ -18,7 +18,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import functools
+import operator
 
 import lxml.etree as ET
 
@@ -31,8 +31,20 @@ import aeneas.globalfunctions as gf
 SMIL_NS = "http://www.w3.org/ns/SMIL"
 EPUB_NS = "http://www.idpf.org/2007/ops"
 
-with_smil_ns = functools.partial(gf.with_ns, ns=SMIL_NS)
-with_epub_ns = functools.partial(gf.with_ns, ns=EPUB_NS)
+# NOTE qualified names used in the (per fragment) loops
+_SMIL_SMIL = f"{{{SMIL_NS}}}smil"
+_SMIL_BODY = f"{{{SMIL_NS}}}body"
+_SMIL_SEQ = f"{{{SMIL_NS}}}seq"
+_SMIL_PAR = f"{{{SMIL_NS}}}par"
+_SMIL_TEXT = f"{{{SMIL_NS}}}text"
+_SMIL_AUDIO = f"{{{SMIL_NS}}}audio"
+_EPUB_TEXTREF = f"{{{EPUB_NS}}}textref"
+_EPUB_TYPE = f"{{{EPUB_NS}}}type"
+
+_get_begin = operator.attrgetter("begin")
+_get_end = operator.attrgetter("end")
+
+_PAR_XPATH = ET.XPath("//smil:par", namespaces={"smil": SMIL_NS})
 
 
 class SyncMapFormatSMIL(SyncMapFormatGenericXML):
@@ -40,6 +52,8 @@ class SyncMapFormatSMIL(SyncMapFormatGenericXML):
     Handler for SMIL for EPUB 3 I/O format.
     """
 
+    __slots__ = ("format_time_function",)
+
     DEFAULT = "smil"
 
     HUMAN = "smilh"
@@ -71,20 +85,33 @@ class SyncMapFormatSMIL(SyncMapFormatGenericXML):
         2. timings must have ``hh:mm:ss.mmm`` or ``ss.mmm`` format (autodetected)
         3. both ``clipBegin`` and ``clipEnd`` attributes of ``<audio>`` must be populated
         """
-        root = ET.fromstring(input_text)
-        for par in root.iter(with_smil_ns("par")):
-            for child in par:
-                if child.tag == with_smil_ns("text"):
-                    identifier = gf.safe_unicode(gf.split_url(child.get("src"))[1])
-                elif child.tag == with_smil_ns("audio"):
-                    begin = self._autodetect_parse_duration(child.get("clipBegin"))
-                    end = self._autodetect_parse_duration(child.get("clipEnd"))
+        if len(input_text) < self.STREAMING_THRESHOLD:
+            pars = _PAR_XPATH(ET.fromstring(input_text))
+        else:
+            pars = self._stream_elements(gf.safe_bytes(input_text), _SMIL_PAR)
+        # NOTE bind the functions used in the loop to locals
+        parse_duration = self._autodetect_parse_duration
+        split_url = gf.split_url
+        safe_unicode = gf.safe_unicode
+        add_fragment = self._add_fragment
+        for par in pars:
+            text = par.find(_SMIL_TEXT)
+            audio = par.find(_SMIL_AUDIO)
+            if text is None or audio is None:
+                raise ValueError(
+                    "The following <par> element is malformed: "
+                    f"{ET.tostring(par, encoding=str, with_tail=False)!r}"
+                )
             # TODO read text from additional text_file?
-            self._add_fragment(
-                syncmap=syncmap, identifier=identifier, lines=[""], begin=begin, end=end
+            add_fragment(
+                syncmap=syncmap,
+                identifier=safe_unicode(split_url(text.get("src"))[1]),
+                lines=[""],
+                begin=parse_duration(audio.get("clipBegin")),
+                end=parse_duration(audio.get("clipEnd")),
             )
 
-    def format(self, syncmap) -> str:
+    def format(self, syncmap, out=None) -> str | None:
         # check for required parameters
         for key in [
             gc.PPN_TASK_OS_FILE_SMIL_PAGE_REF,
@@ -102,111 +129,146 @@ class SyncMapFormatSMIL(SyncMapFormatGenericXML):
         # namespaces
         ns_map = {None: SMIL_NS, "epub": EPUB_NS}
 
-        # build tree
+        # build the skeleton of the tree
         smil_elem = ET.Element(
-            with_smil_ns("smil"),
+            _SMIL_SMIL,
             attrib={
                 "version": "3.0",
             },
             nsmap=ns_map,
         )
-        body_elem = ET.SubElement(smil_elem, with_smil_ns("body"))
-        seq_elem = ET.SubElement(
+        body_elem = ET.SubElement(smil_elem, _SMIL_BODY)
+        ET.SubElement(
             body_elem,
-            with_smil_ns("seq"),
+            _SMIL_SEQ,
             attrib={
                 "id": "seq000001",
-                with_epub_ns("textref"): text_ref,
+                _EPUB_TEXTREF: text_ref,
             },
         )
 
-        if syncmap.is_single_level:
-            # single level
-            for i, fragment in enumerate(syncmap.fragments, 1):
-                text = fragment.text_fragment
-                par_elem = ET.SubElement(
-                    seq_elem,
-                    with_smil_ns("par"),
-                    attrib={
-                        "id": f"par{i:06d}",
-                    },
-                )
-                ET.SubElement(
-                    par_elem,
-                    with_smil_ns("text"),
-                    attrib={
-                        "src": f"{text_ref}#{text.identifier}",
-                    },
-                )
-                ET.SubElement(
-                    par_elem,
-                    with_smil_ns("audio"),
-                    attrib={
-                        "src": audio_ref,
-                        "clipBegin": self.format_time_function(fragment.begin),
-                        "clipEnd": self.format_time_function(fragment.end),
-                    },
+        # NOTE the prefix of the references to the text fragments
+        href_base = text_ref + "#"
+
+        # NOTE bind the callables used in the loops to locals
+        element = ET.Element
+        sub_element = ET.SubElement
+        format_time = self.format_time_function
+        write_subtree = self._write_subtree
+
+        # NOTE the <par> elements are streamed one at a time,
+        #      and they are created without namespace,
+        #      so that they are written in the default (SMIL) namespace
+        def par_element(text_src, clip_begin, clip_end, attrib):
+            par_elem = element("par", attrib=attrib)
+            sub_element(
+                par_elem,
+                "text",
+                attrib={
+                    "src": text_src,
+                },
+            )
+            sub_element(
+                par_elem,
+                "audio",
+                attrib={
+                    "src": audio_ref,
+                    "clipBegin": clip_begin,
+                    "clipEnd": clip_end,
+                },
+            )
+            return par_elem
+
+        def write_single_level(xml_file, level):
+            # NOTE format the clip times of all the fragments at once
+            fragments = syncmap.fragments
+            clip_begins = list(map(format_time, map(_get_begin, fragments)))
+            clip_ends = list(map(format_time, map(_get_end, fragments)))
+            for i, (fragment, clip_begin, clip_end) in enumerate(
+                zip(fragments, clip_begins, clip_ends), 1
+            ):
+                write_subtree(
+                    xml_file,
+                    par_element(
+                        f"{href_base}{fragment.text_fragment.identifier}",
+                        clip_begin,
+                        clip_end,
+                        {"id": "par" + str(i).zfill(6)},
+                    ),
+                    level,
                 )
-        else:
+
+        def write_multi_level(xml_file, level):
             # TODO support generic multiple levels
-            # multiple levels
+            # NOTE the <seq> elements have attributes in the EPUB namespace,
+            #      hence they are written by the incremental writer
+            open_element = self._element
+            word_indentation = "\n" + self.INDENT * (level + 2)
             for par_index, par_child in enumerate(
                 syncmap.fragments_tree.children_not_empty, 1
             ):
-                par_seq_elem = ET.SubElement(
-                    seq_elem,
-                    with_smil_ns("seq"),
+                sen_children = par_child.children_not_empty
+                with open_element(
+                    xml_file,
+                    level,
+                    _SMIL_SEQ,
                     attrib={
                         # COMMENTED "id": f"p{par_index:06d}",
-                        with_epub_ns("type"): "paragraph",
-                        with_epub_ns(
-                            "textref"
-                        ): f"{text_ref}#{par_child.value.text_fragment.identifier}",
+                        _EPUB_TYPE: "paragraph",
+                        _EPUB_TEXTREF: f"{href_base}{par_child.value.text_fragment.identifier}",
                     },
-                )
-                for sen_index, sen_child in enumerate(par_child.children_not_empty, 1):
-                    sen_seq_elem = ET.SubElement(
-                        par_seq_elem,
-                        with_smil_ns("seq"),
-                        attrib={
-                            # COMMENTED "id": par_seq_elem.attrib["id"] + f"s{sen_index:06d}",
-                            with_epub_ns("type"): "sentence",
-                            with_epub_ns(
-                                "textref"
-                            ): f"{text_ref}#{sen_child.value.text_fragment.identifier}",
-                        },
-                    )
-                    for wor_index, wor_child in enumerate(
-                        sen_child.children_not_empty, 1
-                    ):
-                        fragment = wor_child.value
-                        text = fragment.text_fragment
-                        wor_seq_elem = ET.SubElement(
-                            sen_seq_elem,
-                            with_smil_ns("seq"),
-                            attrib={
-                                # COMMENTED "id": sen_seq_elem.attrib["id"] + f"w{wor_index:06d}",
-                                with_epub_ns("type"): "word",
-                                with_epub_ns(
-                                    "textref"
-                                ): f"{text_ref}#{text.identifier}",
-                            },
-                        )
-                        wor_par_elem = ET.SubElement(wor_seq_elem, with_smil_ns("par"))
-                        ET.SubElement(
-                            wor_par_elem,
-                            with_smil_ns("text"),
+                    empty=not sen_children,
+                ):
+                    for sen_index, sen_child in enumerate(sen_children, 1):
+                        wor_children = sen_child.children_not_empty
+                        with open_element(
+                            xml_file,
+                            level + 1,
+                            _SMIL_SEQ,
                             attrib={
-                                "src": f"{text_ref}#{text.identifier}",
+                                # COMMENTED "id": par_seq_elem.attrib["id"] + f"s{sen_index:06d}",
+                                _EPUB_TYPE: "sentence",
+                                _EPUB_TEXTREF: f"{href_base}{sen_child.value.text_fragment.identifier}",
                             },
-                        )
-                        ET.SubElement(
-                            wor_par_elem,
-                            with_smil_ns("audio"),
-                            attrib={
-                                "src": audio_ref,
-                                "clipBegin": self.format_time_function(fragment.begin),
-                                "clipEnd": self.format_time_function(fragment.end),
-                            },
-                        )
-        return self._tree_to_string(smil_elem, xml_declaration=False)
+                            empty=not wor_children,
+                        ):
+                            for wor_index, wor_child in enumerate(wor_children, 1):
+                                fragment = wor_child.value
+                                text_src = (
+                                    f"{href_base}{fragment.text_fragment.identifier}"
+                                )
+                                # NOTE the word <seq> always contains
+                                #      a single <par>: write it without
+                                #      a context manager per word
+                                xml_file.write(word_indentation)
+                                with xml_file.element(
+                                    _SMIL_SEQ,
+                                    {
+                                        # COMMENTED "id": sen_seq_elem.attrib["id"] + f"w{wor_index:06d}",
+                                        _EPUB_TYPE: "word",
+                                        _EPUB_TEXTREF: text_src,
+                                    },
+                                ):
+                                    write_subtree(
+                                        xml_file,
+                                        par_element(
+                                            text_src,
+                                            format_time(fragment.begin),
+                                            format_time(fragment.end),
+                                            {},
+                                        ),
+                                        level + 3,
+                                    )
+                                    xml_file.write(word_indentation)
+
+        if syncmap.is_single_level:
+            # single level
+            write_children = write_single_level if syncmap.fragments else None
+        else:
+            # multiple levels
+            write_children = (
+                write_multi_level if syncmap.fragments_tree.children_not_empty else None
+            )
+        return self._stream_tree(
+            smil_elem, write_children, xml_declaration=False, out=out
+        )
@@ -28,6 +28,8 @@ class SyncMapFormatSRT(SyncMapFormatGenericSubtitles):
     Handler for SubRip (SRT) I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "srt"
 
     #
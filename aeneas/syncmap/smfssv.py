@@ -29,6 +29,8 @@ class SyncMapFormatSSV(SyncMapFormatGenericTabular):
     Handler for space-separated plain text (SSV) I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "ssv"
 
     HUMAN = "ssvh"
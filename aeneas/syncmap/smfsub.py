@@ -28,6 +28,8 @@ class SyncMapFormatSUB(SyncMapFormatGenericSubtitles):
     Handler for SubViewer (SUB) I/O format.
     """
 
+    __slots__ = ()
+
     SUB = "sub"
 
     SBV = "sbv"
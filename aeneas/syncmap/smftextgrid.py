@@ -30,6 +30,8 @@ class SyncMapFormatTextGrid(SyncMapFormatBase):
     Handler for TextGrid I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "textgrid"
 
     LONG = "textgrid_long"
@@ -29,6 +29,8 @@ class SyncMapFormatTSV(SyncMapFormatGenericTabular):
     Handler for tab-separated plain text (TSV) I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "tsv"
 
     HUMAN = "tsvh"
@@ -20,16 +20,61 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import lxml.etree as ET
 
 from aeneas.syncmap.smfgxml import SyncMapFormatGenericXML
 import aeneas.globalfunctions as gf
 
+TTML_NS = "http://www.w3.org/ns/ttml"
+XML_NS = SyncMapFormatGenericXML.XML_NS
+
+# NOTE qualified names used in the (per fragment) loops
+_TTML_TT = f"{{{TTML_NS}}}tt"
+_TTML_BODY = f"{{{TTML_NS}}}body"
+_TTML_DIV = f"{{{TTML_NS}}}div"
+_TTML_P = f"{{{TTML_NS}}}p"
+_XML_ID = f"{{{XML_NS}}}id"
+_XML_LANG = f"{{{XML_NS}}}lang"
+
+_P_XPATH = ET.XPath("//ttml:p", namespaces={"ttml": TTML_NS})
+
+
+def _check_xml_id(identifier: str) -> None:
+    """
+    Raise ``ValueError`` if ``identifier`` cannot be the value
+    of an ``xml:id`` attribute, that is, if it is not an XML name
+    without colons (``NCName``), like ``"1"``.
+    """
+    # NOTE lxml validates tag names as NCNames,
+    #      but it would split a leading {namespace} off
+    try:
+        if not identifier.startswith("{"):
+            ET.QName(identifier)
+            return
+    except ValueError:
+        pass
+    raise ValueError(f"Identifier {identifier!r} is not a valid xml:id value")
+
+
+def _append_lines(parent, lines) -> None:
+    """
+    Append the given text ``lines`` to the ``parent`` element,
+    separated by ``<br/>`` elements, each one followed (as tail)
+    by the next line.
+    """
+    lines = iter(lines)
+    parent.text = next(lines, None) or None
+    for line in lines:
+        ET.SubElement(parent, "br").tail = line or None
+
 
 class SyncMapFormatTTML(SyncMapFormatGenericXML):
     """
     Handler for TTML I/O format.
     """
 
+    __slots__ = ()
+
     TTML = "ttml"
 
     DFXP = "dfxp"
@@ -37,29 +82,25 @@ class SyncMapFormatTTML(SyncMapFormatGenericXML):
     DEFAULT = TTML
 
     def parse(self, input_text, syncmap):
-        from lxml import etree
-
-        ttml_ns = "{http://www.w3.org/ns/ttml}"
-        xml_ns = "{http://www.w3.org/XML/1998/namespace}"
-        root = etree.fromstring(gf.safe_bytes(input_text))
-        language = root.get(xml_ns + "lang")
-        for elem in root.iter(ttml_ns + "p"):
-            identifier = gf.safe_unicode(elem.get(xml_ns + "id"))
-            begin = gf.time_from_ttml(elem.get("begin"))
-            end = gf.time_from_ttml(elem.get("end"))
-            fragment_lines = self._get_lines_from_node_text(elem)
-            self._add_fragment(
+        root = ET.fromstring(gf.safe_bytes(input_text))
+        language = root.get(_XML_LANG)
+        # NOTE bind the functions used in the loop to locals
+        safe_unicode = gf.safe_unicode
+        time_from_ttml = gf.time_from_ttml
+        get_lines = self._get_lines_from_node_text
+        add_fragment = self._add_fragment
+        for elem in _P_XPATH(root):
+            get = elem.get
+            add_fragment(
                 syncmap=syncmap,
-                identifier=identifier,
+                identifier=safe_unicode(get(_XML_ID)),
                 language=language,
-                lines=fragment_lines,
-                begin=begin,
-                end=end,
+                lines=get_lines(elem),
+                begin=time_from_ttml(get("begin")),
+                end=time_from_ttml(get("end")),
             )
 
-    def format(self, syncmap):
-        from lxml import etree
-
+    def format(self, syncmap, out=None):
         # get language
         language = None
         if (self.parameters is not None) and ("language" in self.parameters):
@@ -70,49 +111,73 @@ class SyncMapFormatTTML(SyncMapFormatGenericXML):
             language = ""
 
         # namespaces
-        ttml_ns = "http://www.w3.org/ns/ttml"
-        xml_ns = "http://www.w3.org/XML/1998/namespace"
-        ns_map = {None: ttml_ns}
+        ns_map = {None: TTML_NS}
 
-        # build tree
-        tt_elem = etree.Element("{%s}tt" % ttml_ns, nsmap=ns_map)
-        tt_elem.attrib["{%s}lang" % xml_ns] = language
+        # build the skeleton of the tree
+        tt_elem = ET.Element(_TTML_TT, nsmap=ns_map)
+        tt_elem.attrib[_XML_LANG] = language
         # TODO add metadata from parameters here?
-        # COMMENTED head_elem = etree.SubElement(tt_elem, "{%s}head" % ttml_ns)
-        body_elem = etree.SubElement(tt_elem, "{%s}body" % ttml_ns)
-        div_elem = etree.SubElement(body_elem, "{%s}div" % ttml_ns)
+        # COMMENTED head_elem = etree.SubElement(tt_elem, f"{{{TTML_NS}}}head")
+        body_elem = ET.SubElement(tt_elem, _TTML_BODY)
+        ET.SubElement(body_elem, _TTML_DIV)
 
-        if syncmap.is_single_level:
-            # single level
+        # NOTE bind the callables used in the loops to locals
+        element = ET.Element
+        sub_element = ET.SubElement
+        time_to_ttml = gf.time_to_ttml
+        append_lines = _append_lines
+        check_xml_id = _check_xml_id
+        write_subtree = self._write_subtree
+
+        # NOTE the <p> elements are streamed one at a time,
+        #      and they are created without namespace,
+        #      so that they are written in the default (TTML) namespace
+        def write_single_level(xml_file, level):
             for fragment in syncmap.fragments:
                 text = fragment.text_fragment
-                p_string = '<p xml:id="{}" begin="{}" end="{}">{}</p>'.format(
-                    text.identifier,
-                    gf.time_to_ttml(fragment.begin),
-                    gf.time_to_ttml(fragment.end),
-                    "<br/>".join(text.lines),
+                check_xml_id(text.identifier)
+                p_elem = element(
+                    "p",
+                    attrib={
+                        _XML_ID: text.identifier,
+                        "begin": time_to_ttml(fragment.begin),
+                        "end": time_to_ttml(fragment.end),
+                    },
                 )
-                p_elem = etree.fromstring(p_string)
-                div_elem.append(p_elem)
-        else:
+                append_lines(p_elem, text.lines)
+                write_subtree(xml_file, p_elem, level)
+
+        def write_multi_level(xml_file, level):
             # TODO support generic multiple levels
-            # multiple levels
             for par_child in syncmap.fragments_tree.children_not_empty:
                 text = par_child.value.text_fragment
-                p_elem = etree.SubElement(div_elem, "{%s}p" % ttml_ns)
-                p_elem.attrib["id"] = text.identifier
+                p_elem = element("p", attrib={"id": text.identifier})
                 for sen_child in par_child.children_not_empty:
                     text = sen_child.value.text_fragment
-                    sen_span_elem = etree.SubElement(p_elem, "{%s}span" % ttml_ns)
-                    sen_span_elem.attrib["id"] = text.identifier
+                    sen_span_elem = sub_element(
+                        p_elem, "span", attrib={"id": text.identifier}
+                    )
                     for wor_child in sen_child.children_not_empty:
                         fragment = wor_child.value
-                        wor_span_elem = etree.SubElement(
-                            sen_span_elem, "{%s}span" % ttml_ns
+                        wor_span_elem = sub_element(
+                            sen_span_elem,
+                            "span",
+                            attrib={
+                                "id": fragment.text_fragment.identifier,
+                                "begin": time_to_ttml(fragment.begin),
+                                "end": time_to_ttml(fragment.end),
+                            },
                         )
-                        wor_span_elem.attrib["id"] = fragment.text_fragment.identifier
-                        wor_span_elem.attrib["begin"] = gf.time_to_ttml(fragment.begin)
-                        wor_span_elem.attrib["end"] = gf.time_to_ttml(fragment.end)
-                        wor_span_elem.text = "<br/>".join(fragment.text_fragment.lines)
+                        append_lines(wor_span_elem, fragment.text_fragment.lines)
+                write_subtree(xml_file, p_elem, level)
+
+        if syncmap.is_single_level:
+            # single level
+            write_children = write_single_level if syncmap.fragments else None
+        else:
+            # multiple levels
+            write_children = (
+                write_multi_level if syncmap.fragments_tree.children_not_empty else None
+            )
         # write tree
-        return self._tree_to_string(tt_elem)
+        return self._stream_tree(tt_elem, write_children, out=out)
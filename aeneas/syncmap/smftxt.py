@@ -29,6 +29,8 @@ class SyncMapFormatTXT(SyncMapFormatGenericTabular):
     Handler for space-separated plain text (TXT) I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "txt"
 
     HUMAN = "txth"
@@ -22,12 +22,17 @@
 from aeneas.syncmap.smfgsubtitles import SyncMapFormatGenericSubtitles
 import aeneas.globalfunctions as gf
 
+# NOTE blocks starting with these prefixes carry no cue
+_IGNORED_PREFIXES = ("NOTE", "REGION", "STYLE")
+
 
 class SyncMapFormatVTT(SyncMapFormatGenericSubtitles):
     """
     Handler for WebVTT (VTT) I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "vtt"
 
     def __init__(self, variant=DEFAULT, parameters=None):
@@ -43,8 +48,4 @@ class SyncMapFormatVTT(SyncMapFormatGenericSubtitles):
         self.format_time_function = gf.time_to_hhmmssmmm
 
     def ignore_block(self, block_lines):
-        return len(block_lines) > 0 and (
-            block_lines[0].startswith("NOTE")
-            or block_lines[0].startswith("REGION")
-            or block_lines[0].startswith("STYLE")
-        )
+        return len(block_lines) > 0 and block_lines[0].startswith(_IGNORED_PREFIXES)
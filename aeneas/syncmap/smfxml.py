@@ -20,55 +20,82 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import lxml.etree as ET
 
 from aeneas.syncmap.smfgxml import SyncMapFormatGenericXML
 import aeneas.globalfunctions as gf
 
 
+def _fragment_element(node):
+    """
+    Build the ``<fragment>`` subtree of the given node
+    of the fragments tree, recursively.
+    """
+    fragment = node.value
+    fragment_elem = ET.Element(
+        "fragment",
+        attrib={
+            "id": fragment.text_fragment.identifier,
+            "begin": gf.time_to_ssmmm(fragment.begin),
+            "end": gf.time_to_ssmmm(fragment.end),
+        },
+    )
+    for line in fragment.text_fragment.lines:
+        line_elem = ET.SubElement(fragment_elem, "line")
+        line_elem.text = line
+    children_elem = ET.SubElement(fragment_elem, "children")
+    for child in node.children_not_empty:
+        children_elem.append(_fragment_element(child))
+    return fragment_elem
+
+
 class SyncMapFormatXML(SyncMapFormatGenericXML):
     """
     Handler for XML I/O format.
     """
 
+    __slots__ = ()
+
     DEFAULT = "xml"
 
     def parse(self, input_text, syncmap):
-        from lxml import etree
-
-        root = etree.fromstring(gf.safe_bytes(input_text))
-        for frag in root:
-            identifier = gf.safe_unicode(frag.get("id"))
-            begin = gf.time_from_ssmmm(frag.get("begin"))
-            end = gf.time_from_ssmmm(frag.get("end"))
-            lines = []
-            for child in frag:
-                if child.tag == "line":
-                    lines.append(gf.safe_unicode(child.text))
-            self._add_fragment(
+        data = gf.safe_bytes(input_text)
+        if len(data) < self.STREAMING_THRESHOLD:
+            fragments = ET.fromstring(data)
+        else:
+            # NOTE nested fragments are yielded (and cleared) as well,
+            #      but only the top level ones are read
+            fragments = (
+                frag
+                for frag in self._stream_elements(data, "fragment")
+                if frag.getparent().getparent() is None
+            )
+        # NOTE bind the functions used in the loop to locals;
+        #      lxml returns attribute values and texts as str already
+        time_from_ssmmm = gf.time_from_ssmmm
+        add_fragment = self._add_fragment
+        for frag in fragments:
+            # NOTE findall() filters the children in C;
+            #      text() would skip empty <line/> elements
+            add_fragment(
                 syncmap=syncmap,
-                identifier=identifier,
-                lines=lines,
-                begin=begin,
-                end=end,
+                identifier=frag.get("id"),
+                lines=[line.text for line in frag.findall("line")],
+                begin=time_from_ssmmm(frag.get("begin")),
+                end=time_from_ssmmm(frag.get("end")),
             )
 
-    def format(self, syncmap):
-        from lxml import etree
+    def format(self, syncmap, out=None):
+        write_subtree = self._write_subtree
 
-        def visit_children(node, parent_elem):
-            """Recursively visit the fragments_tree"""
-            for child in node.children_not_empty:
-                fragment = child.value
-                fragment_elem = etree.SubElement(parent_elem, "fragment")
-                fragment_elem.attrib["id"] = fragment.text_fragment.identifier
-                fragment_elem.attrib["begin"] = gf.time_to_ssmmm(fragment.begin)
-                fragment_elem.attrib["end"] = gf.time_to_ssmmm(fragment.end)
-                for line in fragment.text_fragment.lines:
-                    line_elem = etree.SubElement(fragment_elem, "line")
-                    line_elem.text = line
-                children_elem = etree.SubElement(fragment_elem, "children")
-                visit_children(child, children_elem)
+        def write_children(xml_file, level):
+            # NOTE only the subtree of one top level fragment
+            #      is kept in memory at a time
+            for child in children:
+                write_subtree(xml_file, _fragment_element(child), level)
 
-        map_elem = etree.Element("map")
-        visit_children(syncmap.fragments_tree, map_elem)
-        return self._tree_to_string(map_elem)
+        children = syncmap.fragments_tree.children_not_empty
+        map_elem = ET.Element("map")
+        return self._stream_tree(
+            map_elem, write_children if children else None, out=out
+        )
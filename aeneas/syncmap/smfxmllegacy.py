@@ -20,46 +20,73 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import operator
+import xml.sax.saxutils
 
 from aeneas.syncmap.smfgxml import SyncMapFormatGenericXML
 import aeneas.globalfunctions as gf
 
+_HEADER = '<?xml version="1.0" encoding="UTF-8" ?>\n<map>\n'
+_FOOTER = "</map>"
+
 
 class SyncMapFormatXMLLegacy(SyncMapFormatGenericXML):
     """
     Handler for XML (legacy) I/O format. Deprecated.
     """
 
+    __slots__ = ()
+
     DEFAULT = "xml_legacy"
 
     def parse(self, input_text, syncmap):
         from lxml import etree
 
         root = etree.fromstring(gf.safe_bytes(input_text))
+        # NOTE bind the functions used in the loop to locals
+        time_from_ssmmm = gf.time_from_ssmmm
+        add_fragment = self._add_fragment
         for frag in root:
-            for child in frag:
-                if child.tag == "identifier":
-                    identifier = gf.safe_unicode(child.text)
-                elif child.tag == "start":
-                    begin = gf.time_from_ssmmm(child.text)
-                elif child.tag == "end":
-                    end = gf.time_from_ssmmm(child.text)
+            # NOTE map the tags of the children to their texts,
+            #      instead of comparing each tag in turn
+            texts = {child.tag: child.text for child in frag}
+            identifier = texts.get("identifier")
+            start = texts.get("start")
+            end = texts.get("end")
+            if identifier is None or start is None or end is None:
+                raise ValueError(
+                    "The following fragment is malformed: "
+                    f"{etree.tostring(frag, encoding=str, with_tail=False)!r}"
+                )
             # TODO read text from additional text_file?
-            self._add_fragment(
-                syncmap=syncmap, identifier=identifier, lines=[""], begin=begin, end=end
+            add_fragment(
+                syncmap=syncmap,
+                identifier=identifier,
+                lines=[""],
+                begin=time_from_ssmmm(start),
+                end=time_from_ssmmm(end),
             )
 
-    def format(self, syncmap):
-        msg = []
-        msg.append('<?xml version="1.0" encoding="UTF-8" ?>')
-        msg.append("<map>")
-        for fragment in syncmap.fragments:
-            msg.append(" <fragment>")
-            msg.append(
-                "  <identifier>%s</identifier>" % fragment.text_fragment.identifier
-            )
-            msg.append("  <start>%s</start>" % gf.time_to_ssmmm(fragment.begin))
-            msg.append("  <end>%s</end>" % gf.time_to_ssmmm(fragment.end))
-            msg.append(" </fragment>")
-        msg.append("</map>")
-        return "\n".join(msg)
+    def format(self, syncmap, out=None):
+        # NOTE bind the functions used in the loop to locals
+        escape = xml.sax.saxutils.escape
+        fragments = syncmap.fragments
+        # NOTE format the times of all the fragments at once
+        begins = gf.times_to_ssmmm(map(operator.attrgetter("begin"), fragments))
+        ends = gf.times_to_ssmmm(map(operator.attrgetter("end"), fragments))
+        rows = (
+            f" <fragment>\n"
+            f"  <identifier>{escape(fragment.text_fragment.identifier)}</identifier>\n"
+            f"  <start>{begin}</start>\n"
+            f"  <end>{end}</end>\n"
+            f" </fragment>\n"
+            for fragment, begin, end in zip(fragments, begins, ends)
+        )
+        if out is None:
+            return f"{_HEADER}{''.join(rows)}{_FOOTER}"
+        # NOTE write one fragment at a time instead of joining them all
+        out.write(_HEADER.encode("utf-8"))
+        for row in rows:
+            out.write(row.encode("utf-8"))
+        out.write(_FOOTER.encode("utf-8"))
+        return None
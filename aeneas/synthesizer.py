@@ -28,29 +28,108 @@ This module contains the following classes:
 .. warning:: This module might be refactored in a future version
 """
 
+import concurrent.futures
+import functools
 import importlib.util
+import itertools
 import logging
-import os.path
+import time
+import wave
 
+from aeneas.exacttiming import TimeValue
 from aeneas.logger import Configurable
 from aeneas.runtimeconfiguration import RuntimeConfiguration
 from aeneas.textfile import TextFile
-from aeneas.ttswrappers.awsttswrapper import AWSTTSWrapper
-from aeneas.ttswrappers.espeakngttswrapper import ESPEAKNGTTSWrapper
-from aeneas.ttswrappers.espeakttswrapper import ESPEAKTTSWrapper
-from aeneas.ttswrappers.festivalttswrapper import FESTIVALTTSWrapper
-from aeneas.ttswrappers.macosttswrapper import MacOSTTSWrapper
-from aeneas.ttswrappers.nuancettswrapper import NuanceTTSWrapper
+import aeneas.globalfunctions as gf
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _has_module(name):
+    """
+    Return ``True`` if the module with the given name can be imported,
+    looking for it only once.
+    """
+    return importlib.util.find_spec(name) is not None
+
+
+def _aws_tts_wrapper():
+    """
+    Return the AWS Polly TTS API wrapper class,
+    checking that ``boto3`` is installed.
+    """
+    if not _has_module("boto3"):
+        raise ImportError("Unable to import boto3 for AWS Polly TTS API wrapper")
+    from aeneas.ttswrappers.awsttswrapper import AWSTTSWrapper
+
+    return AWSTTSWrapper
+
+
+def _nuance_tts_wrapper():
+    """
+    Return the Nuance TTS API wrapper class,
+    checking that ``requests`` is installed.
+    """
+    if not _has_module("requests"):
+        raise ImportError("Unable to import requests for Nuance TTS API wrapper")
+    from aeneas.ttswrappers.nuancettswrapper import NuanceTTSWrapper
+
+    return NuanceTTSWrapper
+
+
+def _espeak_tts_wrapper():
+    """
+    Return the eSpeak wrapper class.
+    """
+    from aeneas.ttswrappers.espeakttswrapper import ESPEAKTTSWrapper
+
+    return ESPEAKTTSWrapper
+
+
+def _espeakng_tts_wrapper():
+    """
+    Return the eSpeak NG wrapper class.
+    """
+    from aeneas.ttswrappers.espeakngttswrapper import ESPEAKNGTTSWrapper
+
+    return ESPEAKNGTTSWrapper
+
+
+def _festival_tts_wrapper():
+    """
+    Return the Festival wrapper class.
+    """
+    from aeneas.ttswrappers.festivalttswrapper import FESTIVALTTSWrapper
+
+    return FESTIVALTTSWrapper
+
+
+def _macos_tts_wrapper():
+    """
+    Return the macOS "say" wrapper class.
+    """
+    from aeneas.ttswrappers.macosttswrapper import MacOSTTSWrapper
+
+    return MacOSTTSWrapper
+
+
 class Synthesizer(Configurable):
     """
     A class to synthesize text fragments into
     an audio file,
     along with the corresponding time anchors.
 
+    The TTS engine is created once, together with this object,
+    and it can be reused by several calls to :func:`synthesize`.
+    Use the object as a context manager (or call :func:`close`)
+    to release the resources held by the TTS engine
+    (for example, an HTTP session) when done::
+
+        with Synthesizer(rconf=rconf) as synt:
+            for text_file, audio_file_path in jobs:
+                synt.synthesize(text_file, audio_file_path)
+
     :param rconf: a runtime configuration
     :type  rconf: :class:`~aeneas.runtimeconfiguration.RuntimeConfiguration`
     :raises: OSError: if a custom TTS engine is requested
@@ -86,56 +165,57 @@ class Synthesizer(Configurable):
         super().__init__(rconf=rconf)
         self.tts_engine = None
         self._select_tts_engine()
+        # NOTE _select_tts_engine() either sets the TTS engine or raises
+        assert self.tts_engine is not None
 
     def _select_tts_engine(self):
         """
         Select the TTS engine to be used by looking at the rconf object.
         """
-        logger.debug("Selecting TTS engine...")
+        start = time.perf_counter()
         requested_tts_engine = self.rconf[RuntimeConfiguration.TTS]
-        tts_cls = None
-        match requested_tts_engine:
-            case self.AWS:
-                if importlib.util.find_spec("boto3") is None:
-                    raise ImportError(
-                        "Unable to import boto3 for AWS Polly TTS API wrapper"
-                    )
-                tts_cls = AWSTTSWrapper
-            case self.NUANCE:
-                if importlib.util.find_spec("requests") is None:
-                    raise ImportError(
-                        "Unable to import requests for Nuance TTS API wrapper"
-                    )
-                tts_cls = NuanceTTSWrapper
-            case self.ESPEAK:
-                tts_cls = ESPEAKTTSWrapper
-            case self.ESPEAKNG:
-                tts_cls = ESPEAKNGTTSWrapper
-            case self.FESTIVAL:
-                tts_cls = FESTIVALTTSWrapper
-            case self.MACOS:
-                tts_cls = MacOSTTSWrapper
-            case _ as other:
-                raise ValueError(f"Invalid TTS engine type {other!r}")
-
-        logger.debug("Creating %r instance...", tts_cls.__name__)
+        factory = _TTS_REGISTRY.get(requested_tts_engine)
+        if factory is None:
+            raise ValueError(f"Invalid TTS engine type {requested_tts_engine!r}")
+        tts_cls = factory()
         self.tts_engine = tts_cls(rconf=self.rconf)
-        logger.debug("Creating %r instance... done", tts_cls.__name__)
-        logger.debug("Selecting TTS engine... done")
+        logger.debug(
+            "Selected TTS engine %r in %.3f s",
+            tts_cls.__name__,
+            time.perf_counter() - start,
+        )
 
-    @property
+    @functools.cached_property
     def output_audio_format(self):
         """
         Return a tuple ``(codec, channels, rate)``
         specifying the audio format
         generated by the actual TTS engine.
 
+        The value is computed once,
+        as the TTS engine is selected when the object is created.
+
         :rtype: tuple
         """
         if self.tts_engine is not None:
             return self.tts_engine.OUTPUT_AUDIO_FORMAT
         return None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the resources held by the TTS engine.
+
+        .. versionadded:: 1.7.4
+        """
+        if self.tts_engine is not None:
+            self.tts_engine.close()
+
     def clear_cache(self):
         """
         Clear the TTS cache, removing all cache files from disk.
@@ -151,6 +231,8 @@ class Synthesizer(Configurable):
         audio_file_path: str,
         quit_after=None,
         backwards=False,
+        parallel: int = 1,
+        num_chars: int | None = None,
     ):
         """
         Synthesize the text contained in the given fragment list
@@ -158,36 +240,190 @@ class Synthesizer(Configurable):
 
         Return a tuple ``(anchors, total_time, num_chars)``.
 
+        If the text file has no text,
+        an empty audio file is written without calling the TTS engine.
+
+        If ``parallel`` is greater than ``1``,
+        the fragments are split into that many contiguous slices,
+        synthesized by as many worker processes.
+        This is not done for the TTS API wrappers (AWS and Nuance),
+        to stay within their request rate limits,
+        nor if ``quit_after`` or ``backwards`` are given.
+
+        The ``text_file`` does not need to be a
+        :class:`~aeneas.textfile.TextFile`:
+        any object exposing its ``fragments``
+        (a sequence of :class:`~aeneas.textfile.TextFragment`)
+        and the total number of characters ``chars``
+        (an ``int``) is accepted.
+        Parallel synthesis also requires a ``get_slice`` method,
+        otherwise the text is synthesized by a single process.
+
         :param text_file: the text file to be synthesized
         :type  text_file: :class:`~aeneas.textfile.TextFile`
         :param string audio_file_path: the path to the output audio file
         :param float quit_after: stop synthesizing as soon as
                                  reaching this many seconds
         :param bool backwards: if ``True``, synthesizing from the end of the text file
+        :param int parallel: the number of worker processes
+        :param int num_chars: the number of characters of ``text_file``,
+                              if already known by the caller
+
+        .. versionadded:: 1.7.4
+           The ``parallel`` parameter.
+
+        .. versionadded:: 1.7.4
+           The ``num_chars`` parameter.
+
         :rtype: tuple
-        :raises: TypeError: if ``text_file`` is ``None`` or not an instance of ``TextFile``
+        :raises: TypeError: if ``text_file`` is ``None`` or has no ``fragments``
         :raises: OSError: if ``tts=custom`` in the RuntimeConfiguration and ``tts_path`` cannot be read
-        :raises: ValueError: if the TTS engine has not been set yet
         """
-        if text_file is None:
-            raise TypeError("`text_file` is None")
-        if not isinstance(text_file, TextFile):
-            raise TypeError("`text_file` is not an instance of TextFile")
-        if self.tts_engine is None:
-            raise ValueError("Cannot select the TTS engine")
+        if getattr(text_file, "fragments", None) is None:
+            raise TypeError("`text_file` is None or has no fragments")
 
-        # synthesize
-        logger.debug("Synthesizing text...")
-        result = self.tts_engine.synthesize_multiple(
-            text_file=text_file,
-            output_file_path=audio_file_path,
-            quit_after=quit_after,
-            backwards=backwards,
-        )
-        logger.debug("Synthesizing text... done")
+        # NOTE nothing to synthesize: write an empty audio file
+        #      without calling the TTS engine at all
+        if num_chars is None:
+            num_chars = text_file.chars
+        if num_chars == 0:
+            logger.debug("No text to synthesize, writing an empty audio file")
+            self._write_empty_audio_file(audio_file_path)
+            return ([], TimeValue("0.000"), 0)
 
-        # check that the output file has been written
-        if not os.path.isfile(audio_file_path):
-            raise OSError(f"Audio file path {audio_file_path!r} cannot be read")
+        # synthesize
+        start = time.perf_counter()
+        slices = None
+        if (
+            parallel > 1
+            and quit_after is None
+            and not backwards
+            and self.rconf[RuntimeConfiguration.TTS] not in (self.AWS, self.NUANCE)
+        ):
+            slices = self._split_text_file(text_file, parallel)
+        if slices is not None:
+            result = self._synthesize_slices(slices, audio_file_path)
+        else:
+            result = self.tts_engine.synthesize_multiple(
+                text_file=text_file,
+                output_file_path=audio_file_path,
+                quit_after=quit_after,
+                backwards=backwards,
+                num_chars=num_chars,
+            )
+        logger.debug("Synthesized text in %.3f s", time.perf_counter() - start)
 
         return result
+
+    def _write_empty_audio_file(self, audio_file_path):
+        """
+        Write a PCM16 WAVE file without samples,
+        in the output audio format of the TTS engine.
+        """
+        _, channels, sample_rate = self.output_audio_format
+        with wave.open(audio_file_path, "wb") as audio_file:
+            audio_file.setnchannels(channels)
+            audio_file.setsampwidth(2)
+            audio_file.setframerate(sample_rate)
+
+    @staticmethod
+    def _split_text_file(text_file, parallel):
+        """
+        Split the given text file into at most ``parallel``
+        contiguous slices of (roughly) the same number of fragments.
+
+        Return ``None`` if it cannot be split in at least two slices,
+        each one containing some text.
+
+        :rtype: list of :class:`~aeneas.textfile.TextFile`
+        """
+        if not hasattr(text_file, "get_slice"):
+            return None
+        num_fragments = len(text_file.fragments)
+        parallel = min(parallel, num_fragments)
+        if parallel < 2:
+            return None
+        bounds = [num_fragments * i // parallel for i in range(parallel + 1)]
+        slices = [
+            text_file.get_slice(start, end) for start, end in itertools.pairwise(bounds)
+        ]
+        # NOTE the TTS wrappers refuse to synthesize text files without text
+        if any(text_slice.chars == 0 for text_slice in slices):
+            return None
+        return slices
+
+    def _synthesize_slices(self, slices, audio_file_path):
+        """
+        Synthesize the given text file slices in parallel,
+        each one by a worker process,
+        and concatenate their audio files and anchors.
+
+        :rtype: tuple (anchors, total_time, num_chars)
+        """
+        logger.debug("Synthesizing %d slices in parallel...", len(slices))
+        tmp_path = self.rconf[RuntimeConfiguration.TMP_PATH]
+        tmp_files = [gf.tmp_file(suffix=".wav", root=tmp_path) for _ in slices]
+        try:
+            with concurrent.futures.ProcessPoolExecutor(len(slices)) as executor:
+                results = list(
+                    executor.map(
+                        _synthesize_slice,
+                        itertools.repeat(self.rconf),
+                        slices,
+                        [file_path for _, file_path in tmp_files],
+                    )
+                )
+            anchors = []
+            total_time = TimeValue("0.000")
+            num_chars = 0
+            # NOTE the slices are PCM WAVE files with the same parameters,
+            #      so their frames are concatenated as they are
+            with wave.open(audio_file_path, "wb") as output_file:
+                for (_, file_path), (slice_anchors, slice_time, slice_chars) in zip(
+                    tmp_files, results
+                ):
+                    with wave.open(file_path, "rb") as slice_file:
+                        if output_file.getnframes() == 0:
+                            output_file.setparams(slice_file.getparams())
+                        output_file.writeframes(
+                            slice_file.readframes(slice_file.getnframes())
+                        )
+                    anchors.extend(
+                        [total_time + time, identifier, text]
+                        for time, identifier, text in slice_anchors
+                    )
+                    total_time += slice_time
+                    num_chars += slice_chars
+        finally:
+            for file_handler, file_path in tmp_files:
+                gf.delete_file(file_handler, file_path)
+        logger.debug("Synthesizing %d slices in parallel... done", len(slices))
+        return (anchors, total_time, num_chars)
+
+
+def _synthesize_slice(rconf, text_file, audio_file_path):
+    """
+    Synthesize the given text file into ``audio_file_path``,
+    in a worker process.
+
+    :rtype: tuple (anchors, total_time, num_chars)
+    """
+    with Synthesizer(rconf=rconf) as synt:
+        try:
+            return synt.synthesize(text_file, audio_file_path)
+        finally:
+            # NOTE the cache files of the worker are not known to the parent,
+            #      so they must be removed here
+            synt.clear_cache()
+
+
+# NOTE map each TTS engine name to a function returning its wrapper class;
+#      the wrapper modules are imported only when selected
+_TTS_REGISTRY = {
+    Synthesizer.AWS: _aws_tts_wrapper,
+    Synthesizer.NUANCE: _nuance_tts_wrapper,
+    Synthesizer.ESPEAK: _espeak_tts_wrapper,
+    Synthesizer.ESPEAKNG: _espeakng_tts_wrapper,
+    Synthesizer.FESTIVAL: _festival_tts_wrapper,
+    Synthesizer.MACOS: _macos_tts_wrapper,
+}
@@ -41,6 +41,35 @@ import aeneas.globalfunctions as gf
 
 logger = logging.getLogger(__name__)
 
+# NOTE the task configuration fields passed to TextFile,
+#      by their canonical names, which need no alias lookup
+_TEXT_FILE_PARAMETERS = (
+    gc.PPN_TASK_IS_TEXT_FILE_IGNORE_REGEX,
+    gc.PPN_TASK_IS_TEXT_FILE_TRANSLITERATE_MAP,
+    gc.PPN_TASK_IS_TEXT_MPLAIN_WORD_SEPARATOR,
+    gc.PPN_TASK_IS_TEXT_MUNPARSED_L1_ID_REGEX,
+    gc.PPN_TASK_IS_TEXT_MUNPARSED_L2_ID_REGEX,
+    gc.PPN_TASK_IS_TEXT_MUNPARSED_L3_ID_REGEX,
+    gc.PPN_TASK_IS_TEXT_UNPARSED_CLASS_REGEX,
+    gc.PPN_TASK_IS_TEXT_UNPARSED_ID_REGEX,
+    gc.PPN_TASK_IS_TEXT_UNPARSED_ID_SORT,
+    gc.PPN_TASK_OS_FILE_ID_REGEX,
+)
+
+# NOTE the task configuration fields holding the arguments
+#      of each adjust boundary algorithm
+_ABA_PARAMETERS = {
+    AdjustBoundaryAlgorithm.AFTERCURRENT: (
+        gc.PPN_TASK_ADJUST_BOUNDARY_AFTERCURRENT_VALUE,
+    ),
+    AdjustBoundaryAlgorithm.AUTO: (),
+    AdjustBoundaryAlgorithm.BEFORENEXT: (gc.PPN_TASK_ADJUST_BOUNDARY_BEFORENEXT_VALUE,),
+    AdjustBoundaryAlgorithm.OFFSET: (gc.PPN_TASK_ADJUST_BOUNDARY_OFFSET_VALUE,),
+    AdjustBoundaryAlgorithm.PERCENT: (gc.PPN_TASK_ADJUST_BOUNDARY_PERCENT_VALUE,),
+    AdjustBoundaryAlgorithm.RATE: (gc.PPN_TASK_ADJUST_BOUNDARY_RATE_VALUE,),
+    AdjustBoundaryAlgorithm.RATEAGGRESSIVE: (gc.PPN_TASK_ADJUST_BOUNDARY_RATE_VALUE,),
+}
+
 
 class Task:
     """
@@ -53,17 +82,31 @@ class Task:
                         it is not a Unicode string
     """
 
+    __slots__ = (
+        "__identifier",
+        "audio_file_path",
+        "__audio_file_path_absolute",
+        "audio_file",
+        "text_file_path",
+        "__text_file_path_absolute",
+        "text_file",
+        "sync_map_file_path",
+        "__sync_map_file_path_absolute",
+        "sync_map",
+        "configuration",
+    )
+
     def __init__(self, config_string=None):
         self.identifier = str(uuid.uuid4())
         # relative to input container root
         self.audio_file_path = None
         # concrete path, file will be read from this!
-        self.audio_file_path_absolute = None
+        self.__audio_file_path_absolute = None
         self.audio_file = None
         # relative to input container root
         self.text_file_path = None
         # concrete path, file will be read from this!
-        self.text_file_path_absolute = None
+        self.__text_file_path_absolute = None
         self.text_file = None
         # relative to output container root
         self.sync_map_file_path = None
@@ -116,6 +159,13 @@ class Task:
 
     @audio_file_path_absolute.setter
     def audio_file_path_absolute(self, audio_file_path_absolute):
+        # NOTE do not read the same audio file again
+        if (
+            audio_file_path_absolute == self.__audio_file_path_absolute
+            and self.audio_file is not None
+        ):
+            logger.debug("Audio file %r already read", audio_file_path_absolute)
+            return
         self.__audio_file_path_absolute = audio_file_path_absolute
         self._populate_audio_file()
 
@@ -130,6 +180,13 @@ class Task:
 
     @text_file_path_absolute.setter
     def text_file_path_absolute(self, text_file_path_absolute):
+        # NOTE do not parse the same text file again
+        if (
+            text_file_path_absolute == self.__text_file_path_absolute
+            and self.text_file is not None
+        ):
+            logger.debug("Text file %r already read", text_file_path_absolute)
+            return
         self.__text_file_path_absolute = text_file_path_absolute
         self._populate_text_file()
 
@@ -189,18 +246,11 @@ class Task:
         if container_root_path is not None and self.sync_map_file_path is None:
             raise TypeError("The (internal) path of the sync map has been set")
 
-        logger.debug("container_root_path is %s", container_root_path)
-        logger.debug("self.sync_map_file_path is %s", self.sync_map_file_path)
-        logger.debug(
-            "self.sync_map_file_path_absolute is %s", self.sync_map_file_path_absolute
-        )
-
         if container_root_path is not None and self.sync_map_file_path is not None:
             path = os.path.join(container_root_path, self.sync_map_file_path)
         elif self.sync_map_file_path_absolute:
             path = self.sync_map_file_path_absolute
         gf.ensure_parent_directory(path)
-        logger.debug("Output sync map to %s", path)
 
         eaf_audio_ref = self.configuration["o_eaf_audio_ref"]
         head_tail_format = self.configuration["o_h_t_format"]
@@ -209,12 +259,29 @@ class Task:
         smil_page_ref = self.configuration["o_smil_page_ref"]
         sync_map_format = self.configuration["o_format"]
 
-        logger.debug("eaf_audio_ref is %s", eaf_audio_ref)
-        logger.debug("head_tail_format is %s", head_tail_format)
-        logger.debug("levels is %s", levels)
-        logger.debug("smil_audio_ref is %s", smil_audio_ref)
-        logger.debug("smil_page_ref is %s", smil_page_ref)
-        logger.debug("sync_map_format is %s", sync_map_format)
+        # NOTE a single record, formatted only if debug logging is enabled
+        logger.debug(
+            "Output sync map to %s\n"
+            "  container_root_path is %s\n"
+            "  self.sync_map_file_path is %s\n"
+            "  self.sync_map_file_path_absolute is %s\n"
+            "  eaf_audio_ref is %s\n"
+            "  head_tail_format is %s\n"
+            "  levels is %s\n"
+            "  smil_audio_ref is %s\n"
+            "  smil_page_ref is %s\n"
+            "  sync_map_format is %s",
+            path,
+            container_root_path,
+            self.sync_map_file_path,
+            self.sync_map_file_path_absolute,
+            eaf_audio_ref,
+            head_tail_format,
+            levels,
+            smil_audio_ref,
+            smil_page_ref,
+            sync_map_format,
+        )
 
         logger.debug("Calling sync_map.write...")
         parameters = {
@@ -255,42 +322,14 @@ class Task:
             and self.configuration["language"] is not None
         ):
             # the following values might be None
-            parameters = {
-                gc.PPN_TASK_IS_TEXT_FILE_IGNORE_REGEX: self.configuration[
-                    "i_t_ignore_regex"
-                ],
-                gc.PPN_TASK_IS_TEXT_FILE_TRANSLITERATE_MAP: self.configuration[
-                    "i_t_transliterate_map"
-                ],
-                gc.PPN_TASK_IS_TEXT_MPLAIN_WORD_SEPARATOR: self.configuration[
-                    "i_t_mplain_word_separator"
-                ],
-                gc.PPN_TASK_IS_TEXT_MUNPARSED_L1_ID_REGEX: self.configuration[
-                    "i_t_munparsed_l1_id_regex"
-                ],
-                gc.PPN_TASK_IS_TEXT_MUNPARSED_L2_ID_REGEX: self.configuration[
-                    "i_t_munparsed_l2_id_regex"
-                ],
-                gc.PPN_TASK_IS_TEXT_MUNPARSED_L3_ID_REGEX: self.configuration[
-                    "i_t_munparsed_l3_id_regex"
-                ],
-                gc.PPN_TASK_IS_TEXT_UNPARSED_CLASS_REGEX: self.configuration[
-                    "i_t_unparsed_class_regex"
-                ],
-                gc.PPN_TASK_IS_TEXT_UNPARSED_ID_REGEX: self.configuration[
-                    "i_t_unparsed_id_regex"
-                ],
-                gc.PPN_TASK_IS_TEXT_UNPARSED_ID_SORT: self.configuration[
-                    "i_t_unparsed_id_sort"
-                ],
-                gc.PPN_TASK_OS_FILE_ID_REGEX: self.configuration["o_id_regex"],
-            }
+            configuration = self.configuration
+            parameters = {key: configuration[key] for key in _TEXT_FILE_PARAMETERS}
             self.text_file = TextFile(
                 file_path=self.text_file_path_absolute,
-                file_format=self.configuration["i_t_format"],
+                file_format=configuration["i_t_format"],
                 parameters=parameters,
             )
-            self.text_file.set_language(self.configuration["language"])
+            self.text_file.set_language(configuration["language"])
         else:
             logger.debug("text_file_path_absolute and/or language is None")
         logger.debug("Populate text file... done")
@@ -608,27 +647,6 @@ class TaskConfiguration(Configuration):
 
         :rtype: dict
         """
-        ABA_MAP = {
-            AdjustBoundaryAlgorithm.AFTERCURRENT: [
-                self[gc.PPN_TASK_ADJUST_BOUNDARY_AFTERCURRENT_VALUE]
-            ],
-            AdjustBoundaryAlgorithm.AUTO: [],
-            AdjustBoundaryAlgorithm.BEFORENEXT: [
-                self[gc.PPN_TASK_ADJUST_BOUNDARY_BEFORENEXT_VALUE]
-            ],
-            AdjustBoundaryAlgorithm.OFFSET: [
-                self[gc.PPN_TASK_ADJUST_BOUNDARY_OFFSET_VALUE]
-            ],
-            AdjustBoundaryAlgorithm.PERCENT: [
-                self[gc.PPN_TASK_ADJUST_BOUNDARY_PERCENT_VALUE]
-            ],
-            AdjustBoundaryAlgorithm.RATE: [
-                self[gc.PPN_TASK_ADJUST_BOUNDARY_RATE_VALUE]
-            ],
-            AdjustBoundaryAlgorithm.RATEAGGRESSIVE: [
-                self[gc.PPN_TASK_ADJUST_BOUNDARY_RATE_VALUE]
-            ],
-        }
         aba_algorithm = (
             self[gc.PPN_TASK_ADJUST_BOUNDARY_ALGORITHM] or AdjustBoundaryAlgorithm.AUTO
         )
@@ -636,7 +654,10 @@ class TaskConfiguration(Configuration):
         ns_string = self[gc.PPN_TASK_ADJUST_BOUNDARY_NONSPEECH_STRING]
         nozero = self[gc.PPN_TASK_ADJUST_BOUNDARY_NO_ZERO] or False
         return {
-            "algorithm": (aba_algorithm, ABA_MAP[aba_algorithm]),
+            "algorithm": (
+                aba_algorithm,
+                [self[key] for key in _ABA_PARAMETERS[aba_algorithm]],
+            ),
             "nonspeech": (ns_min, ns_string),
             "nozero": nozero,
         }
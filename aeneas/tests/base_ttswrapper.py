@@ -50,6 +50,12 @@ class BaseTTSWrapperCase(unittest.TestCase):
     TTS_LANGUAGE: typing.ClassVar[str] = "eng"
     TTS_LANGUAGE_VARIATION: typing.ClassVar[str | None] = None
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # NOTE the TTS engine does not appear or disappear during the tests
+        cls.tts_path_exists = bool(cls.TTS_PATH) and os.path.isfile(cls.TTS_PATH)
+
     def synthesize(
         self,
         text_file,
@@ -63,7 +69,7 @@ class BaseTTSWrapperCase(unittest.TestCase):
             self.skipTest("`self.TTS` is not set")
         elif not self.TTS_PATH:
             self.skipTest("`self.TTS_PATH` is not set")
-        elif not os.path.isfile(self.TTS_PATH):
+        elif not self.tts_path_exists:
             self.skipTest(f"`self.TTS_PATH` ({self.TTS_PATH}) does not exist")
 
         def inner(case: SynthesizeCase):
@@ -75,32 +81,30 @@ class BaseTTSWrapperCase(unittest.TestCase):
                 else:
                     output_file_path = ofp
 
-                try:
-                    rconf = RuntimeConfiguration()
-                    rconf[RuntimeConfiguration.TTS] = self.TTS
-                    rconf[RuntimeConfiguration.TTS_PATH] = self.TTS_PATH
-                    rconf[RuntimeConfiguration.C_EXTENSIONS] = case.c_ext
-                    rconf[RuntimeConfiguration.CEW_SUBPROCESS_ENABLED] = (
-                        case.cew_subprocess
-                    )
-                    rconf[RuntimeConfiguration.TTS_CACHE] = case.cache
-                    tts_engine = self.TTS_CLASS(rconf=rconf)
-                    anchors, total_time, num_chars = tts_engine.synthesize_multiple(
-                        text_file, output_file_path, quit_after, backwards
-                    )
-                    if case.cache:
-                        tts_engine.clear_cache()
-
-                    if zero_length:
-                        self.assertEqual(total_time, 0.0)
-                    else:
-                        self.assertGreater(total_time, 0.0)
-
-                except (OSError, TypeError, UnicodeDecodeError, ValueError) as exc:
-                    if case.cache and tts_engine is not None:
-                        tts_engine.clear_cache()
+                rconf = RuntimeConfiguration()
+                rconf[RuntimeConfiguration.TTS] = self.TTS
+                rconf[RuntimeConfiguration.TTS_PATH] = self.TTS_PATH
+                rconf[RuntimeConfiguration.C_EXTENSIONS] = case.c_ext
+                rconf[RuntimeConfiguration.CEW_SUBPROCESS_ENABLED] = case.cew_subprocess
+                rconf[RuntimeConfiguration.TTS_CACHE] = case.cache
+                tts_engine = self.TTS_CLASS(rconf=rconf)
+                if case.cache:
+                    exit_stack.callback(tts_engine.clear_cache)
+
+                if expected_exc is not None:
                     with self.assertRaises(expected_exc):
-                        raise exc
+                        tts_engine.synthesize_multiple(
+                            text_file, output_file_path, quit_after, backwards
+                        )
+                    return
+
+                anchors, total_time, num_chars = tts_engine.synthesize_multiple(
+                    text_file, output_file_path, quit_after, backwards
+                )
+                if zero_length:
+                    self.assertEqual(total_time, 0.0)
+                else:
+                    self.assertGreater(total_time, 0.0)
 
         for case in self.iter_synthesize_cases():
             with self.subTest(case=case):
@@ -1,3 +1,4 @@
+import multiprocessing
 import unittest
 import typing
 import os
@@ -27,6 +28,55 @@ bench_test = unittest.skipIf(
 )
 
 
+def bench_execute_task(parameters: typing.Sequence[tuple[str, str]]) -> int:
+    params = ["placeholder"]
+    with tempfile.TemporaryDirectory(prefix="aeneas.") as temp_dir:
+        for p_type, p_value in parameters:
+            if p_type == "in":
+                params.append(os.path.join(BENCH_DIR, p_value))
+            elif p_type == "out":
+                params.append(os.path.join(temp_dir, p_value))
+            else:
+                params.append(p_value)
+
+        return ExecuteTaskCLI(use_sys=False).run(arguments=params)
+
+
+class BenchExecuteTaskCLICase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # NOTE one worker process is reused by all the cases of the class,
+        #      so the interpreter and aeneas imports are set up only once
+        cls.pool = multiprocessing.Pool(processes=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+        cls.pool.join()
+        super().tearDownClass()
+
+    def bench_execute(
+        self,
+        parameters: typing.Sequence[tuple[str, str]],
+        expected_exit_code: int,
+        timeout: float,
+    ):
+        # NOTE the exit code is checked here, in the test process,
+        #      so a wrong exit code fails the test
+        result = self.pool.apply_async(bench_execute_task, (parameters,))
+        try:
+            exit_code = result.get(timeout)
+        except multiprocessing.TimeoutError:
+            # NOTE kill the stuck worker and start a fresh one
+            #      for the following cases
+            self.pool.terminate()
+            type(self).pool = multiprocessing.Pool(processes=1)
+            self.fail(f"bench case did not finish within {timeout} seconds")
+
+        self.assertEqual(exit_code, expected_exit_code)
+
+
 class ExecuteCLICase(unittest.TestCase):
     CLI_CLS: typing.ClassVar
 
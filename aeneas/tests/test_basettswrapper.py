@@ -0,0 +1,188 @@
+# aeneas is a Python/C library and a set of tools
+# to automagically synchronize audio and text (aka forced alignment)
+#
+# Copyright (C) 2012-2013, Alberto Pettarin (www.albertopettarin.it)
+# Copyright (C) 2013-2015, ReadBeyond Srl   (www.readbeyond.it)
+# Copyright (C) 2015-2017, Alberto Pettarin (www.albertopettarin.it)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+import wave
+
+import numpy
+
+from aeneas.exacttiming import TimeValue
+from aeneas.language import Language
+from aeneas.runtimeconfiguration import RuntimeConfiguration
+from aeneas.textfile import TextFile, TextFragment
+from aeneas.ttswrappers.basettswrapper import BaseTTSWrapper, DiskTTSCache
+
+
+class FakeTTSWrapper(BaseTTSWrapper):
+    DEFAULT_LANGUAGE = Language.ENG
+    LANGUAGE_TO_VOICE_CODE = {Language.ENG: "en"}
+    HAS_PYTHON_CALL = True
+    OUTPUT_AUDIO_FORMAT = ("pcm_s16le", 1, 16000)
+
+    def _synthesize_single_python_helper(
+        self, text, voice_code, output_file_path=None, return_audio_data=True
+    ):
+        # NOTE one distinct sample per character, ord(c) / 256
+        samples = numpy.array([ord(c) for c in text]) / 256
+        return (True, (TimeValue(len(text)) / 16000, 16000, "pcm_s16le", samples))
+
+
+class TestDiskTTSCache(unittest.TestCase):
+    # NOTE the 44 bytes of the WAVE header, plus 10 int16_t samples
+    FILE_SIZE = 64
+
+    def samples(self, value: float):
+        return numpy.full(10, value)
+
+    def test_key(self):
+        key = DiskTTSCache.key("engine", "en", "text")
+        self.assertEqual(len(key), 64)
+        self.assertEqual(key, DiskTTSCache.key("engine", "en", "text"))
+        self.assertNotEqual(key, DiskTTSCache.key("engine", "it", "text"))
+        self.assertNotEqual(key, DiskTTSCache.key("other", "en", "text"))
+
+    def test_get_missing(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DiskTTSCache(os.path.join(tmp_dir, "cache"), 1024)
+            self.assertIsNone(cache.get(cache.key("engine", "en", "text")))
+
+    def test_put_get(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DiskTTSCache(os.path.join(tmp_dir, "cache"), 1024)
+            key = cache.key("engine", "en", "text")
+            cache.put(key, 16000, self.samples(0.5))
+            sample_rate, samples = cache.get(key)
+            self.assertEqual(sample_rate, 16000)
+            numpy.testing.assert_array_equal(samples, self.samples(0.5))
+            self.assertEqual(len(os.listdir(cache.path)), 1)
+
+    def test_put_tracks_size(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DiskTTSCache(os.path.join(tmp_dir, "cache"), 1024)
+            key = cache.key("engine", "en", "text")
+            cache.put(key, 16000, self.samples(0.5))
+            cache.put(cache.key("engine", "en", "other"), 16000, self.samples(0.5))
+            # NOTE replacing a cached file does not change the total size
+            cache.put(key, 16000, self.samples(0.25))
+            self.assertEqual(cache._size, 2 * self.FILE_SIZE)
+
+    def test_evict_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DiskTTSCache(os.path.join(tmp_dir, "cache"), 2 * self.FILE_SIZE)
+            keys = [cache.key("engine", "en", text) for text in "abc"]
+            cache.put(keys[0], 16000, self.samples(0.5))
+            cache.put(keys[1], 16000, self.samples(0.5))
+            os.utime(cache._file_path(keys[0]), (0, 0))
+            os.utime(cache._file_path(keys[1]), (1, 1))
+            # NOTE reading a file marks it as the most recently used
+            cache.get(keys[0])
+            cache.put(keys[2], 16000, self.samples(0.5))
+            self.assertIsNotNone(cache.get(keys[0]))
+            self.assertIsNone(cache.get(keys[1]))
+            self.assertIsNotNone(cache.get(keys[2]))
+            self.assertEqual(cache._size, 2 * self.FILE_SIZE)
+
+
+class TestSynthesizeMultipleGeneric(unittest.TestCase):
+    def synthesize(self, backwards: bool):
+        text_file = TextFile()
+        for identifier, text in [("f1", "abc"), ("f2", "de")]:
+            text_file.add_fragment(
+                TextFragment(identifier, Language.ENG, [text], [text])
+            )
+        tts = FakeTTSWrapper()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "out.wav")
+            result, (anchors, current_time, num_chars) = (
+                tts._synthesize_multiple_generic(
+                    helper_function=tts._synthesize_single_python_helper,
+                    text_file=text_file,
+                    output_file_path=path,
+                    backwards=backwards,
+                )
+            )
+            with wave.open(path, "rb") as f:
+                params = (f.getnchannels(), f.getsampwidth(), f.getframerate())
+                frames = f.readframes(f.getnframes())
+        self.assertTrue(result)
+        self.assertEqual(num_chars, 5)
+        self.assertEqual(current_time, TimeValue(5) / 16000)
+        self.assertEqual(params, (1, 2, 16000))
+        return anchors, numpy.frombuffer(frames, dtype="<i2")
+
+    def expected_frames(self, text: str):
+        return numpy.array([ord(c) * 128 for c in text])
+
+    def test_synthesize_forward(self):
+        anchors, frames = self.synthesize(backwards=False)
+        self.assertEqual(
+            anchors,
+            [
+                [TimeValue("0.000"), "f1", "abc"],
+                [TimeValue(3) / 16000, "f2", "de"],
+            ],
+        )
+        numpy.testing.assert_array_equal(frames, self.expected_frames("abcde"))
+
+    def test_synthesize_backwards(self):
+        anchors, frames = self.synthesize(backwards=True)
+        self.assertEqual(
+            anchors,
+            [
+                [TimeValue("0.000"), "f2", "de"],
+                [TimeValue(2) / 16000, "f1", "abc"],
+            ],
+        )
+        # NOTE the fragments are synthesized in reverse order,
+        #      but the output audio is reversed back at the end
+        numpy.testing.assert_array_equal(frames, self.expected_frames("abcde"))
+
+
+class TestSynthesizeMultipleDiskCache(unittest.TestCase):
+    def test_miss_then_hit(self):
+        text_file = TextFile()
+        for identifier, text in [("f1", "abc"), ("f2", "de")]:
+            text_file.add_fragment(
+                TextFragment(identifier, Language.ENG, [text], [text])
+            )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rconf = RuntimeConfiguration()
+            rconf[RuntimeConfiguration.TTS_CACHE_PATH] = os.path.join(tmp_dir, "cache")
+            tts = FakeTTSWrapper(rconf=rconf)
+            path = os.path.join(tmp_dir, "out.wav")
+            results = []
+            for _ in range(2):
+                with unittest.mock.patch.object(
+                    tts,
+                    "_synthesize_single_python_helper",
+                    wraps=tts._synthesize_single_python_helper,
+                ) as helper:
+                    anchors, current_time, num_chars = tts.synthesize_multiple(
+                        text_file, path
+                    )
+                with open(path, "rb") as f:
+                    results.append((helper.call_count, current_time, f.read()))
+        (misses, miss_time, miss_wav), (hits, hit_time, hit_wav) = results
+        self.assertEqual((misses, hits), (2, 0))
+        self.assertEqual(hit_time, miss_time)
+        self.assertEqual(hit_wav, miss_wav)
@@ -20,42 +20,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import multiprocessing
-import os
-import unittest
-import tempfile
-
-from aeneas.tools.execute_task import ExecuteTaskCLI
-from aeneas.tests.common import BENCH_DIR, bench_test
+from aeneas.tests.common import BenchExecuteTaskCLICase, bench_test
 
 
 @bench_test
-class TestBenchmarkExecuteTaskCLI(unittest.TestCase):
-    def bench_execute(self, parameters, expected_exit_code, timeout):
-        args = (parameters, expected_exit_code)
-        p = multiprocessing.Process(target=self.execute, name="funcExecute", args=args)
-        p.start()
-        p.join(timeout)
-        if p.is_alive():
-            p.terminate()
-            p.join()
-            self.assertTrue(False)
-
-    def execute(self, parameters, expected_exit_code):
-        params = ["placeholder"]
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            for p_type, p_value in parameters:
-                if p_type == "in":
-                    params.append(os.path.join(BENCH_DIR, p_value))
-                elif p_type == "out":
-                    params.append(os.path.join(tmp_dir, p_value))
-                else:
-                    params.append(p_value)
-
-            exit_code = ExecuteTaskCLI(use_sys=False).run(arguments=params)
-
-        self.assertEqual(exit_code, expected_exit_code)
-
+class TestBenchmarkExecuteTaskCLI(BenchExecuteTaskCLICase):
     def test_001_mplain(self):
         self.bench_execute(
             [
@@ -18,27 +18,30 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import importlib.util
 import unittest
 
 import numpy
 
 import aeneas.globalfunctions as gf
 
+try:
+    from aeneas.cdtw import cdtw
+except ImportError:
+    cdtw = None
 
-@unittest.skipIf(
-    importlib.util.find_spec("aeneas.cdtw.cdtw") is None,
-    "CDTW C extension is not available",
-)
+
+@unittest.skipIf(cdtw is None, "CDTW C extension is not available")
 class TestCDTW(unittest.TestCase):
     MFCC1 = gf.absolute_path("res/cdtw/mfcc1_12_1332", __file__)
     MFCC2 = gf.absolute_path("res/cdtw/mfcc2_12_868", __file__)
 
-    def test_compute_path(self):
-        import aeneas.cdtw.cdtw as cdtw
+    @classmethod
+    def setUpClass(cls):
+        cls.mfcc1 = numpy.loadtxt(cls.MFCC1)
+        cls.mfcc2 = numpy.loadtxt(cls.MFCC2)
 
-        mfcc1 = numpy.loadtxt(self.MFCC1)
-        mfcc2 = numpy.loadtxt(self.MFCC2)
+    def test_compute_path(self):
+        mfcc1, mfcc2 = self.mfcc1, self.mfcc2
         l, n = mfcc1.shape
         l, m = mfcc2.shape
         delta = 3000
@@ -18,15 +18,16 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import importlib.util
 import tempfile
 import unittest
 
+try:
+    from aeneas.cengw import cengw
+except ImportError:
+    cengw = None
 
-@unittest.skipIf(
-    importlib.util.find_spec("aeneas.cengw.cengw") is None,
-    "CENGW C extension is not available",
-)
+
+@unittest.skipIf(cengw is None, "CENGW C extension is not available")
 class TestCENGW(unittest.TestCase):
     def test_cengw_synthesize_multiple(self):
         for name, (
@@ -58,8 +59,6 @@ class TestCENGW(unittest.TestCase):
                 3,
             ),
         }.items():
-            import aeneas.cengw.cengw as cengw
-
             c_quit_after, c_backwards = 0.0, 0
             with (
                 self.subTest(name=name),
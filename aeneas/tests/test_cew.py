@@ -18,15 +18,16 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import importlib.util
 import tempfile
 import unittest
 
+try:
+    from aeneas.cew import cew
+except ImportError:
+    cew = None
 
-@unittest.skipIf(
-    importlib.util.find_spec("aeneas.cew.cew") is None,
-    "CEW C extension is not available",
-)
+
+@unittest.skipIf(cew is None, "CEW C extension is not available")
 class TestCEW(unittest.TestCase):
     def test_cew_synthesize_multiple(self):
         for name, (
@@ -58,8 +59,6 @@ class TestCEW(unittest.TestCase):
                 3,
             ),
         }.items():
-            import aeneas.cew.cew as cew
-
             c_quit_after, c_backwards = 0.0, 0
             with (
                 self.subTest(name=name),
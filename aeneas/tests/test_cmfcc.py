@@ -21,26 +21,25 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import unittest
-import importlib.util
 
 from aeneas.audiofile import AudioFile
 import aeneas.globalfunctions as gf
 
+try:
+    from aeneas.cmfcc import cmfcc
+except ImportError:
+    cmfcc = None
 
-@unittest.skipIf(
-    importlib.util.find_spec("aeneas.cmfcc.cmfcc") is None,
-    "CMFCC C extension is not available",
-)
+
+@unittest.skipIf(cmfcc is None, "CMFCC C extension is not available")
 class TestCMFCC(unittest.TestCase):
     AUDIO = gf.absolute_path("res/audioformats/mono.16000.wav", __file__)
 
     def test_compute_mfcc(self):
-        import aeneas.cmfcc.cmfcc
-
         audio_file = AudioFile(self.AUDIO)
         audio_file.read_samples_from_file()
         mfcc_c = (
-            aeneas.cmfcc.cmfcc.compute_from_data(
+            cmfcc.compute_from_data(
                 audio_file.audio_samples,
                 audio_file.audio_sample_rate,
                 40,
@@ -23,6 +23,7 @@
 import unittest
 
 from aeneas.configuration import Configuration
+from aeneas.runtimeconfiguration import RuntimeConfiguration
 
 
 class TestConfiguration(unittest.TestCase):
@@ -43,3 +44,10 @@ class TestConfiguration(unittest.TestCase):
         d = c.clone()
         self.assertNotEqual(id(c), id(d))
         self.assertEqual(c.config_string, d.config_string)
+
+    def test_instances_do_not_share_data(self):
+        c = RuntimeConfiguration()
+        d = RuntimeConfiguration()
+        c[RuntimeConfiguration.TTS] = "festival"
+        self.assertIs(c.types, d.types)
+        self.assertEqual(d[RuntimeConfiguration.TTS], "espeak-ng")
@@ -20,8 +20,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import itertools
-
 from aeneas.tests.base_ttswrapper import BaseTTSWrapperCase, SynthesizeCase
 from aeneas.ttswrappers.espeakttswrapper import ESPEAKTTSWrapper
 
@@ -34,8 +32,12 @@ class TestESPEAKTTSWrapper(BaseTTSWrapperCase):
     TTS_LANGUAGE_VARIATION = ESPEAKTTSWrapper.ENG_GBR
 
     def iter_synthesize_cases(self):
-        for v in itertools.product([True, False], repeat=3):
-            yield SynthesizeCase(*v)
+        # NOTE cew_subprocess has no effect without c_ext
+        yield SynthesizeCase(c_ext=True, cew_subprocess=False, cache=True)
+        yield SynthesizeCase(c_ext=True, cew_subprocess=False, cache=False)
+        yield SynthesizeCase(c_ext=True, cew_subprocess=True, cache=True)
+        yield SynthesizeCase(c_ext=False, cew_subprocess=False, cache=True)
+        yield SynthesizeCase(c_ext=False, cew_subprocess=False, cache=False)
 
     def test_multiple_replace_language(self):
         tfl = self.tfl(
@@ -399,6 +399,13 @@ class TestGlobalFunctions(unittest.TestCase):
             with self.subTest(value=value, expected=expected):
                 self.assertEqual(gf.time_to_ssmmm(value), expected)
 
+    def test_times_to_ssmmm(self):
+        values = [None, 0, 1, 1.234, TimeValue("12.3455"), TimeValue("12.3465")]
+        self.assertEqual(
+            gf.times_to_ssmmm(values), [gf.time_to_ssmmm(value) for value in values]
+        )
+        self.assertEqual(gf.times_to_ssmmm([]), [])
+
     def test_time_from_hhmmssmmm(self):
         for value, expected in (
             (None, TimeValue("0.000")),
@@ -18,7 +18,9 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import unittest
+import unittest.mock
 import tempfile
 import typing
 import os.path
@@ -26,6 +28,9 @@ import os.path
 from aeneas.exacttiming import TimeInterval, TimeValue
 from aeneas.language import Language
 from aeneas.syncmap import SyncMap, SyncMapFormat, SyncMapFragment
+from aeneas.syncmap.smfeaf import SyncMapFormatEAF
+from aeneas.syncmap.smfsmil import SyncMapFormatSMIL
+from aeneas.syncmap.smfxml import SyncMapFormatXML
 from aeneas.syncmap.missingparametererror import SyncMapMissingParameterError
 from aeneas.tree import Tree
 from aeneas.textfile import TextFragment
@@ -368,6 +373,175 @@ class TestSyncMap(BaseSyncMapCase):
         parameters = {gc.PPN_SYNCMAP_LANGUAGE: Language.ENG}
         self.write(fmt, parameters=parameters)
 
+    def test_read_ttml_lines(self):
+        syn = self.read(SyncMapFormat.TTML, multiline=True, utf8=True)
+        self.assertEqual(
+            syn.fragments[1].text_fragment.lines,
+            ["From fairest creatures", "we desire increase,"],
+        )
+        for fragment in syn.fragments:
+            for line in fragment.text_fragment.lines:
+                self.assertIsInstance(line, str)
+
+    def test_write_ttml_escaped_lines(self):
+        syn = SyncMap()
+        syn.add_fragment(
+            SyncMapFragment(
+                text_fragment=TextFragment(
+                    identifier="f000001", lines=["a < b", "c & d"]
+                ),
+                interval=TimeInterval(begin=TimeValue("0.000"), end=TimeValue("1.000")),
+            )
+        )
+        with tempfile.NamedTemporaryFile(suffix=".ttml") as tmp_file:
+            syn.write(SyncMapFormat.TTML, tmp_file.name)
+            syn2 = SyncMap()
+            syn2.read(SyncMapFormat.TTML, tmp_file.name)
+        self.assertEqual(syn2.fragments[0].text_fragment.lines, ["a < b", "c & d"])
+
+    def test_write_ttml_invalid_identifier(self):
+        writer = SyncMapFormat.CODE_TO_CLASS[SyncMapFormat.TTML](
+            variant=SyncMapFormat.TTML
+        )
+        for identifier in ["1", "a:b", "{a}b"]:
+            with self.subTest(identifier=identifier):
+                syn = SyncMap()
+                syn.add_fragment(
+                    SyncMapFragment(
+                        text_fragment=TextFragment(identifier=identifier, lines=["a"]),
+                        interval=TimeInterval(
+                            begin=TimeValue("0.000"), end=TimeValue("1.000")
+                        ),
+                    )
+                )
+                with self.assertRaises(ValueError):
+                    writer.format(syn)
+
+    def test_write_ttml_multi_level_lines(self):
+        def fragment_tree(identifier, lines=None):
+            return Tree(
+                value=SyncMapFragment(
+                    text_fragment=TextFragment(identifier=identifier, lines=lines),
+                    interval=TimeInterval(
+                        begin=TimeValue("0.000"), end=TimeValue("1.000")
+                    ),
+                )
+            )
+
+        paragraph = fragment_tree("p000001")
+        sentence = fragment_tree("s000001")
+        sentence.add_child(fragment_tree("w000001", lines=["a < b", "c"]))
+        paragraph.add_child(sentence)
+        syn = SyncMap()
+        syn.fragments_tree.add_child(paragraph)
+        writer = SyncMapFormat.CODE_TO_CLASS[SyncMapFormat.TTML](
+            variant=SyncMapFormat.TTML
+        )
+        self.assertIn(
+            '<span id="w000001" begin="0.000s" end="1.000s">a &lt; b<br/>c</span>',
+            writer.format(syn),
+        )
+
+    def test_write_xml_legacy_escaped_identifier(self):
+        syn = SyncMap()
+        syn.add_fragment(
+            SyncMapFragment(
+                text_fragment=TextFragment(identifier="f<1>&2", lines=["a"]),
+                interval=TimeInterval(begin=TimeValue("0.000"), end=TimeValue("1.000")),
+            )
+        )
+        with tempfile.NamedTemporaryFile(suffix=".xml") as tmp_file:
+            syn.write(SyncMapFormat.XML_LEGACY, tmp_file.name)
+            syn2 = SyncMap()
+            syn2.read(SyncMapFormat.XML_LEGACY, tmp_file.name)
+        self.assertEqual(syn2.fragments[0].text_fragment.identifier, "f<1>&2")
+
+    def test_format_xml_out(self):
+        syn = self.read(SyncMapFormat.XML, multiline=True, utf8=True)
+        for fmt in [
+            SyncMapFormat.SMIL,
+            SyncMapFormat.TTML,
+            SyncMapFormat.XML,
+            SyncMapFormat.XML_LEGACY,
+        ]:
+            with self.subTest(fmt=fmt):
+                writer = SyncMapFormat.CODE_TO_CLASS[fmt](
+                    variant=fmt, parameters=self.PARAMETERS
+                )
+                out = io.BytesIO()
+                self.assertIsNone(writer.format(syn, out=out))
+                self.assertEqual(out.getvalue().decode("utf-8"), writer.format(syn))
+
+    def test_read_streaming(self):
+        for fmt, cls in [
+            (SyncMapFormat.EAF, SyncMapFormatEAF),
+            (SyncMapFormat.SMIL, SyncMapFormatSMIL),
+            (SyncMapFormat.XML, SyncMapFormatXML),
+        ]:
+            with self.subTest(fmt=fmt):
+                expected = self.read(fmt, multiline=True, utf8=True)
+                with unittest.mock.patch.object(cls, "STREAMING_THRESHOLD", 0):
+                    syn = self.read(fmt, multiline=True, utf8=True)
+                self.assertEqual(len(syn), len(expected))
+                for fragment, other in zip(syn.fragments, expected.fragments):
+                    self.assertEqual(fragment.identifier, other.identifier)
+                    self.assertEqual(fragment.interval, other.interval)
+                    self.assertEqual(
+                        fragment.text_fragment.lines, other.text_fragment.lines
+                    )
+
+    def test_read_csv_long_text_field(self):
+        text = "a" * 200000
+        syn = SyncMap()
+        reader = SyncMapFormat.CODE_TO_CLASS[SyncMapFormat.CSV](
+            variant=SyncMapFormat.CSV
+        )
+        reader.parse(f'f001,0.000,1.000,"{text}"', syn)
+        self.assertEqual(syn.fragments[0].text_fragment.text, text)
+
+    def test_read_malformed(self):
+        for fmt, text in [
+            (
+                SyncMapFormat.XML_LEGACY,
+                "<map><fragment><start>0.000</start><end>1.000</end></fragment></map>",
+            ),
+            (
+                SyncMapFormat.SMIL,
+                '<smil xmlns="http://www.w3.org/ns/SMIL"><body><seq><par>'
+                '<audio src="a.mp3" clipBegin="0.000" clipEnd="1.000"/>'
+                "</par></seq></body></smil>",
+            ),
+        ]:
+            with self.subTest(fmt=fmt):
+                reader = SyncMapFormat.CODE_TO_CLASS[fmt](variant=fmt)
+                with self.assertRaises(ValueError):
+                    reader.parse(text, SyncMap())
+
+    def test_read_smil_mixed_time_formats(self):
+        smil = """<smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
+ <body>
+  <seq>
+   <par>
+    <text src="p.xhtml#f001"/>
+    <audio src="a.mp3" clipBegin="0.000" clipEnd="59.500"/>
+   </par>
+   <par>
+    <text src="p.xhtml#f002"/>
+    <audio src="a.mp3" clipBegin="59.500" clipEnd="0:01:02.500"/>
+   </par>
+  </seq>
+ </body>
+</smil>"""
+        syn = SyncMap()
+        SyncMapFormatSMIL(variant=SyncMapFormat.SMIL).parse(smil, syn)
+        self.assertEqual(
+            [(f.identifier, f.begin, f.end) for f in syn.fragments],
+            [
+                ("f001", TimeValue("0.000"), TimeValue("59.500")),
+                ("f002", TimeValue("59.500"), TimeValue("62.500")),
+            ],
+        )
+
     def test_output_html_for_tuning(self):
         syn = self.read(SyncMapFormat.XML, multiline=True, utf8=True)
         with tempfile.NamedTemporaryFile(suffix=".html") as tmp_file:
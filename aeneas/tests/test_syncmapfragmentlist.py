@@ -18,12 +18,14 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from decimal import Decimal
 import unittest
 import typing
 
 from aeneas.exacttiming import TimeInterval, TimeValue
 from aeneas.syncmap.fragment import FragmentType, SyncMapFragment
 from aeneas.syncmap.fragmentlist import SyncMapFragmentList
+from aeneas.textfile import TextFragment
 
 
 class TestSyncMapFragmentList(unittest.TestCase):
@@ -212,6 +214,41 @@ class TestSyncMapFragmentList(unittest.TestCase):
         with self.assertRaises(ValueError):
             fragment_list.add(fragment, sort=True)
 
+    def test_time_interval_list_deferred_sort(self):
+        fragment_list = SyncMapFragmentList(
+            begin=TimeValue("0.000"), end=TimeValue("10.000")
+        )
+        with fragment_list.deferred_sort():
+            for interval_begin, interval_end in (
+                ("2.000", "3.000"),
+                ("0.000", "1.000"),
+                ("1.000", "2.000"),
+            ):
+                interval = TimeInterval(
+                    begin=TimeValue(interval_begin), end=TimeValue(interval_end)
+                )
+                fragment_list.add(SyncMapFragment(interval=interval))
+            self.assertFalse(fragment_list.is_guaranteed_sorted)
+        self.assertTrue(fragment_list.is_guaranteed_sorted)
+        self.assertEqual(
+            [f.begin for f in fragment_list.fragments],
+            [TimeValue("0.000"), TimeValue("1.000"), TimeValue("2.000")],
+        )
+
+    def test_time_interval_list_deferred_sort_bad(self):
+        fragment_list = SyncMapFragmentList(
+            begin=TimeValue("0.000"), end=TimeValue("10.000")
+        )
+        with self.assertRaises(ValueError), fragment_list.deferred_sort():
+            for interval_begin, interval_end in (
+                ("1.000", "2.000"),
+                ("0.500", "1.500"),
+            ):
+                interval = TimeInterval(
+                    begin=TimeValue(interval_begin), end=TimeValue(interval_end)
+                )
+                fragment_list.add(SyncMapFragment(interval=interval))
+
     def test_time_interval_list_add_sorted(self):
         cases = (
             (
@@ -1053,3 +1090,27 @@ class TestSyncMapFragmentList(unittest.TestCase):
                     )
                     expected_fragment = SyncMapFragment(interval=expected_interval)
                     self.assertEqual(fragment, expected_fragment)
+
+    def test_fragments_faster_than(self):
+        fragment_list = SyncMapFragmentList(
+            begin=TimeValue("0.000"), end=TimeValue("10.000")
+        )
+        for begin, end, text, fragment_type in (
+            ("0.000", "1.000", "abcdefghij", FragmentType.HEAD),
+            ("1.000", "2.000", "abcdefghij", FragmentType.REGULAR),
+            ("2.000", "3.000", "abcde", FragmentType.REGULAR),
+            ("3.000", "3.000", "abcde", FragmentType.REGULAR),
+            ("3.000", "5.000", "abcdefghijklmnopqrst", FragmentType.REGULAR),
+            ("5.000", "6.000", "abcdefghijk", FragmentType.REGULAR),
+        ):
+            fragment_list.add(
+                SyncMapFragment.from_begin_end(
+                    begin=TimeValue(begin),
+                    end=TimeValue(end),
+                    text_fragment=TextFragment(lines=[text], filtered_lines=[text]),
+                    fragment_type=fragment_type,
+                )
+            )
+        self.assertEqual(fragment_list.fragments_faster_than(Decimal("10")), [1, 4, 5])
+        self.assertEqual(fragment_list.fragments_faster_than(Decimal("10.001")), [5])
+        self.assertEqual(fragment_list.fragments_faster_than(Decimal("12")), [])
@@ -19,8 +19,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import unittest
-import itertools
 import tempfile
+import types
+import wave
 
 from aeneas.exacttiming import TimeValue
 from aeneas.language import Language
@@ -41,24 +42,35 @@ class TestSynthesizer(unittest.TestCase):
         expected_total_time: TimeValue | None = None,
         quit_after: TimeValue | None = None,
         backwards: bool = False,
+        parallel: int = 1,
     ):
         def inner(c_ext: bool, cew_subprocess: bool, tts_cache: bool):
             tfl = TextFile(gf.absolute_path(path, __file__), TextFileFormat.PLAIN)
             tfl.set_language(Language.ENG)
-            synth = Synthesizer()
-            synth.rconf[RuntimeConfiguration.C_EXTENSIONS] = c_ext
-            synth.rconf[RuntimeConfiguration.CEW_SUBPROCESS_ENABLED] = cew_subprocess
-            synth.rconf[RuntimeConfiguration.TTS_CACHE] = tts_cache
+            rconf = RuntimeConfiguration()
+            rconf[RuntimeConfiguration.C_EXTENSIONS] = c_ext
+            rconf[RuntimeConfiguration.CEW_SUBPROCESS_ENABLED] = cew_subprocess
+            rconf[RuntimeConfiguration.TTS_CACHE] = tts_cache
+            synth = Synthesizer(rconf=rconf)
             with tempfile.NamedTemporaryFile(suffix=".wav") as tmp_file:
                 anchors, total_time, _ = synth.synthesize(
-                    tfl, tmp_file.name, quit_after=quit_after, backwards=backwards
+                    tfl,
+                    tmp_file.name,
+                    quit_after=quit_after,
+                    backwards=backwards,
+                    parallel=parallel,
                 )
             self.assertEqual(len(anchors), expected_anchors)
             if expected_total_time is not None:
                 self.assertAlmostEqual(total_time, expected_total_time, places=0)
 
-        for c_ext, cew_subprocess, tts_cache in itertools.product(
-            [True, False], repeat=3
+        # NOTE cew_subprocess has no effect without c_ext
+        for c_ext, cew_subprocess, tts_cache in (
+            (True, False, True),
+            (True, False, False),
+            (True, True, True),
+            (False, False, True),
+            (False, False, False),
         ):
             inner(c_ext, cew_subprocess, tts_cache)
 
@@ -66,6 +78,10 @@ class TestSynthesizer(unittest.TestCase):
         synth = Synthesizer()
         synth.clear_cache()
 
+    def test_context_manager(self):
+        with Synthesizer() as synth:
+            self.assertIsNotNone(synth.tts_engine)
+
     def test_synthesize_none(self):
         synth = Synthesizer()
         with self.assertRaises(TypeError):
@@ -76,6 +92,27 @@ class TestSynthesizer(unittest.TestCase):
         with self.assertRaises(TypeError):
             synth.synthesize("foo", self.PATH_NOT_WRITEABLE)
 
+    def test_synthesize_duck_typed_text_file(self):
+        synth = Synthesizer()
+        text_file = types.SimpleNamespace(fragments=[], chars=0)
+        with tempfile.NamedTemporaryFile(suffix=".wav") as tmp_file:
+            anchors, total_time, num_chars = synth.synthesize(text_file, tmp_file.name)
+        self.assertEqual(anchors, [])
+        self.assertEqual(num_chars, 0)
+
+    def test_synthesize_empty(self):
+        synth = Synthesizer()
+        with tempfile.NamedTemporaryFile(suffix=".wav") as tmp_file:
+            anchors, total_time, num_chars = synth.synthesize(TextFile(), tmp_file.name)
+            with wave.open(tmp_file.name, "rb") as audio_file:
+                self.assertEqual(audio_file.getnframes(), 0)
+                self.assertEqual(
+                    audio_file.getframerate(), synth.output_audio_format[2]
+                )
+        self.assertEqual(anchors, [])
+        self.assertEqual(total_time, TimeValue("0.000"))
+        self.assertEqual(num_chars, 0)
+
     def test_synthesize(self):
         self.perform("res/inputtext/sonnet_plain.txt", 15)
 
@@ -102,5 +139,45 @@ class TestSynthesizer(unittest.TestCase):
             backwards=True,
         )
 
+    def test_synthesize_parallel(self):
+        tfl = TextFile(
+            gf.absolute_path("res/inputtext/sonnet_plain.txt", __file__),
+            TextFileFormat.PLAIN,
+        )
+        tfl.set_language(Language.ENG)
+
+        def synthesize(parallel: int):
+            with (
+                Synthesizer() as synth,
+                tempfile.NamedTemporaryFile(suffix=".wav") as tmp_file,
+            ):
+                anchors, total_time, _ = synth.synthesize(
+                    tfl, tmp_file.name, parallel=parallel
+                )
+                with wave.open(tmp_file.name, "rb") as audio_file:
+                    frames = audio_file.readframes(audio_file.getnframes())
+            return anchors, total_time, frames
+
+        anchors, total_time, frames = synthesize(4)
+        expected_anchors, expected_total_time, expected_frames = synthesize(1)
+        self.assertEqual(len(anchors), 15)
+        self.assertEqual(anchors, expected_anchors)
+        self.assertEqual(total_time, expected_total_time)
+        self.assertEqual(frames, expected_frames)
+
+    def test_split_text_file(self):
+        tfl = TextFile(
+            gf.absolute_path("res/inputtext/sonnet_plain.txt", __file__),
+            TextFileFormat.PLAIN,
+        )
+        slices = Synthesizer._split_text_file(tfl, 4)
+        self.assertEqual([len(text_slice) for text_slice in slices], [3, 4, 4, 4])
+        self.assertEqual(
+            [f.identifier for s in slices for f in s.fragments],
+            [f.identifier for f in tfl.fragments],
+        )
+        self.assertEqual(len(Synthesizer._split_text_file(tfl, 100)), 15)
+        self.assertIsNone(Synthesizer._split_text_file(tfl, 1))
+
     def test_synthesize_plain_with_empty_lines(self):
         self.perform("res/inputtext/plain_with_empty_lines.txt", 19)
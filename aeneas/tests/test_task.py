@@ -158,6 +158,11 @@ class TestTask(unittest.TestCase):
         self.assertIsNone(task.sync_map_file_path)
         self.assertIsNone(task.sync_map_file_path_absolute)
 
+    def test_task_no_unknown_attributes(self):
+        task = Task()
+        with self.assertRaises(AttributeError):
+            task.foo = "bar"
+
     def test_task_sync_map_leaves_empty(self):
         task = Task()
         self.assertEqual(len(task.sync_map_leaves()), 0)
@@ -281,6 +286,17 @@ class TestTask(unittest.TestCase):
             "res/inputtext/sonnet_subtitles.txt", TextFileFormat.SUBTITLES, 15
         )
 
+    def test_set_text_file_same_path(self):
+        task = Task()
+        task.configuration = TaskConfiguration()
+        task.configuration["language"] = Language.ENG
+        task.configuration["i_t_format"] = TextFileFormat.PLAIN
+        path = gf.absolute_path("res/inputtext/sonnet_plain.txt", __file__)
+        task.text_file_path_absolute = path
+        text_file = task.text_file
+        task.text_file_path_absolute = path
+        self.assertIs(task.text_file, text_file)
+
     def test_output_sync_map(self):
         task = Task()
         task.configuration = TaskConfiguration()
@@ -177,12 +177,15 @@ class SynthesizeTextCLI(AbstractCLIProgram):
             self.print_info(f"Stop synthesizing upon reaching {quit_after:.3f} seconds")
 
         try:
-            synt = Synthesizer(rconf=self.rconf)
-            synt.synthesize(
-                text_slice, output_file_path, quit_after=quit_after, backwards=backwards
-            )
-            self.print_info(f"Created file {output_file_path!r}")
-            synt.clear_cache()
+            with Synthesizer(rconf=self.rconf) as synt:
+                synt.synthesize(
+                    text_slice,
+                    output_file_path,
+                    quit_after=quit_after,
+                    backwards=backwards,
+                )
+                self.print_info(f"Created file {output_file_path!r}")
+                synt.clear_cache()
             return self.NO_ERROR_EXIT_CODE
         except ImportError as exc:
             tts = self.rconf[RuntimeConfiguration.TTS]
@@ -260,6 +260,18 @@ class AWSTTSWrapper(BaseTTSWrapper):
 
     def __init__(self, rconf=None):
         super().__init__(rconf=rconf)
+        self._polly_client = None
+
+    def close(self):
+        """
+        Release the ``boto3`` Polly client, if any.
+
+        .. versionadded:: 1.7.4
+        """
+        if self._polly_client is not None:
+            logger.debug("Closing Polly client")
+            self._polly_client.close()
+            self._polly_client = None
 
     def _synthesize_single_python_helper(
         self, text, voice_code, output_file_path=None, return_audio_data=True
@@ -269,8 +281,10 @@ class AWSTTSWrapper(BaseTTSWrapper):
 
         logger.debug("Importing boto3... done")
 
-        # prepare client
-        polly_client = boto3.client("polly")
+        # prepare client, reused by the following calls
+        if self._polly_client is None:
+            self._polly_client = boto3.client("polly")
+        polly_client = self._polly_client
 
         # post request
         sleep_delay = self.rconf[RuntimeConfiguration.TTS_API_SLEEP]
@@ -23,15 +23,22 @@ This module contains the following classes:
 
 * :class:`~aeneas.ttswrappers.basettswrapper.TTSCache`,
   a TTS cache;
+* :class:`~aeneas.ttswrappers.basettswrapper.DiskTTSCache`,
+  a persistent TTS cache;
 * :class:`~aeneas.ttswrappers.basettswrapper.BaseTTSWrapper`,
   an abstract wrapper for a TTS engine.
 """
 
 import contextlib
+import hashlib
 import logging
+import os
 import subprocess
 import tempfile
 import typing
+import wave
+
+import numpy
 
 from aeneas.audiofile import AudioFile, AudioFileUnsupportedFormatError
 from aeneas.exacttiming import TimeValue
@@ -133,6 +140,137 @@ class TTSCache(Configurable):
         logger.debug("Clearing cache... done")
 
 
+class DiskTTSCache:
+    """
+    A persistent TTS cache, that is,
+    a directory containing one PCM16 mono WAVE file
+    for each distinct ``(engine, voice_code, text)`` key,
+    named after the SHA-256 digest of the key.
+
+    The files store the samples already converted
+    to the sample rate used for the alignment,
+    so that reading them back does not call ``ffmpeg``.
+
+    The files are kept across runs.
+    When their total size exceeds ``max_size``,
+    the least recently used files are removed.
+
+    :param string path: the path of the cache directory
+    :param int max_size: the maximum size of the cache, in bytes
+
+    .. versionadded:: 1.7.4
+    """
+
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        # NOTE the total size of the cached files,
+        #      computed (lazily) by scanning the cache directory only once,
+        #      and then kept up to date by put() and _evict()
+        self._size = None
+
+    @staticmethod
+    def key(engine, voice_code, text):
+        """
+        Return the key of the given text,
+        synthesized by the given engine with the given voice.
+
+        :param string engine: the name of the TTS engine
+        :param string voice_code: the voice code
+        :param string text: the synthesized text
+        :rtype: string
+        """
+        return hashlib.sha256(f"{engine}|{voice_code}|{text}".encode()).hexdigest()
+
+    def _file_path(self, key):
+        return os.path.join(self.path, f"{key}.wav")
+
+    def get(self, key):
+        """
+        Return the sample rate and the samples cached with the given key,
+        or ``None`` if the key is not present in the cache.
+
+        :param string key: the key
+        :rtype: tuple (int, :class:`numpy.ndarray`)
+        """
+        file_path = self._file_path(key)
+        try:
+            # NOTE touch the file, so that it is evicted last
+            os.utime(file_path)
+            with wave.open(file_path, "rb") as wav_file:
+                sample_rate = wav_file.getframerate()
+                frames = wav_file.readframes(wav_file.getnframes())
+        except (OSError, EOFError, wave.Error):
+            return None
+        # NOTE the samples are stored as little-endian int16_t,
+        #      our value is a float64 in [-1, 1]
+        return (sample_rate, numpy.frombuffer(frames, dtype="<i2") / 32768)
+
+    def put(self, key, sample_rate, samples):
+        """
+        Store the given samples into the cache with the given key,
+        removing the least recently used files
+        if the cache grows larger than its maximum size.
+
+        :param string key: the key
+        :param int sample_rate: the sample rate of the samples
+        :param samples: the samples, as float64 values in [-1, 1]
+        :type  samples: :class:`numpy.ndarray`
+        :raises: OSError: if the samples cannot be written into the cache
+        """
+        os.makedirs(self.path, exist_ok=True)
+        if self._size is None:
+            self._size = sum(entry[1] for entry in self._entries())
+        file_path = self._file_path(key)
+        # NOTE write to a temporary file first, so that other processes
+        #      sharing the cache never read a partially written file
+        handler, tmp_path = tempfile.mkstemp(suffix=".part", dir=self.path)
+        try:
+            with os.fdopen(handler, "wb") as tmp_file:
+                with wave.open(tmp_file, "wb") as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(2)
+                    wav_file.setframerate(sample_rate)
+                    wav_file.writeframes((samples * 32768).astype("<i2").tobytes())
+            new_size = os.path.getsize(tmp_path)
+            try:
+                old_size = os.path.getsize(file_path)
+            except OSError:
+                old_size = 0
+            os.replace(tmp_path, file_path)
+        except OSError:
+            gf.delete_file(None, tmp_path)
+            raise
+        self._size += new_size - old_size
+        if self._size > self.max_size:
+            self._evict()
+
+    def _entries(self):
+        """
+        Return the list of ``(mtime, size, path)`` of the cached files.
+        """
+        entries = []
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.endswith(".wav") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        # NOTE scan the directory again, since other processes
+        #      might share the cache
+        entries = self._entries()
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, file_path in sorted(entries):
+            if size <= self.max_size:
+                break
+            logger.debug("Evicting cached file %r", file_path)
+            gf.delete_file(None, file_path)
+            size -= file_size
+        self._size = size
+
+
 class BaseTTSWrapper(Configurable):
     """
     An abstract wrapper for a TTS engine.
@@ -292,8 +430,18 @@ class BaseTTSWrapper(Configurable):
 
         self.use_cache = self.rconf[RuntimeConfiguration.TTS_CACHE]
         self.cache = TTSCache(rconf=rconf) if self.use_cache else None
+        cache_path = self.rconf[RuntimeConfiguration.TTS_CACHE_PATH]
+        self.disk_cache = (
+            DiskTTSCache(
+                os.path.expanduser(cache_path),
+                self.rconf[RuntimeConfiguration.TTS_CACHE_SIZE] * 1024 * 1024,
+            )
+            if cache_path is not None
+            else None
+        )
         logger.debug("TTS path is             %s", self.tts_path)
         logger.debug("TTS cache?              %s", self.use_cache)
+        logger.debug("TTS cache path          %s", cache_path)
         logger.debug("Has Python      call?   %s", self.HAS_PYTHON_CALL)
         logger.debug("Has C extension call?   %s", self.HAS_C_EXTENSION_CALL)
         logger.debug("Has subprocess  call?   %s", self.HAS_SUBPROCESS_CALL)
@@ -343,6 +491,18 @@ class BaseTTSWrapper(Configurable):
             logger.debug("Requested to clear TTS cache")
             self.cache.clear()
 
+    def close(self):
+        """
+        Release the resources held by the TTS engine,
+        for example an HTTP session.
+
+        The base implementation does nothing,
+        concrete subclasses holding resources
+        across multiple calls must override it.
+
+        .. versionadded:: 1.7.4
+        """
+
     def set_subprocess_arguments(self, subprocess_arguments):
         """
         Set the list of arguments that the wrapper will pass to ``subprocess``.
@@ -366,7 +526,12 @@ class BaseTTSWrapper(Configurable):
         logger.debug("Subprocess arguments: %s", subprocess_arguments)
 
     def synthesize_multiple(
-        self, text_file, output_file_path, quit_after=None, backwards=False
+        self,
+        text_file,
+        output_file_path,
+        quit_after=None,
+        backwards=False,
+        num_chars=None,
     ):
         """
         Synthesize the text contained in the given fragment list
@@ -388,7 +553,13 @@ class BaseTTSWrapper(Configurable):
                                  reaching this many seconds
         :type quit_after: :class:`~aeneas.exacttiming.TimeValue`
         :param bool backwards: if > 0, synthesize from the end of the text file
+        :param int num_chars: the number of characters of ``text_file``,
+                              if already known by the caller
         :rtype: tuple (anchors, total_time, num_chars)
+
+        .. versionadded:: 1.7.4
+           The ``num_chars`` parameter.
+
         :raises: TypeError: if ``text_file`` is ``None`` or
                             one of the text fragments is not a Unicode string
         :raises: ValueError: if ``self.rconf[RuntimeConfiguration.ALLOW_UNLISTED_LANGUAGES]`` is ``False``
@@ -402,7 +573,9 @@ class BaseTTSWrapper(Configurable):
             raise TypeError("`text_file` is None")
         if len(text_file) < 1:
             raise ValueError("The text file has no fragments")
-        if text_file.chars == 0:
+        if num_chars is None:
+            num_chars = text_file.chars
+        if num_chars == 0:
             raise ValueError("All fragments in the text file are empty")
         if not self.rconf[RuntimeConfiguration.ALLOW_UNLISTED_LANGUAGES]:
             for fragment in text_file.fragments:
@@ -448,8 +621,13 @@ class BaseTTSWrapper(Configurable):
 
         # call _synthesize_multiple_c_extension() or _synthesize_multiple_subprocess()
         logger.debug("Calling TTS engine via C extension or subprocess")
+        # NOTE the C extension synthesizes all the fragments at once,
+        #      so it is bypassed when the persistent cache is used
+        use_c_extension = self.HAS_C_EXTENSION_CALL and not (
+            self.disk_cache is not None and self.HAS_SUBPROCESS_CALL
+        )
         c_extension_function = (
-            self._synthesize_multiple_c_extension if self.HAS_C_EXTENSION_CALL else None
+            self._synthesize_multiple_c_extension if use_c_extension else None
         )
         subprocess_function = (
             self._synthesize_multiple_subprocess if self.HAS_SUBPROCESS_CALL else None
@@ -762,11 +940,74 @@ class BaseTTSWrapper(Configurable):
         logger.debug("  sample rate: %d", sample_rate)
 
         # open output file
-        output_file = AudioFile(rconf=self.rconf)
-        output_file.audio_format = codec
-        output_file.audio_channels = 1
-        output_file.audio_sample_rate = sample_rate
+        # NOTE when synthesizing forward, the samples of each fragment
+        #      are streamed to the output file as soon as they are available,
+        #      otherwise they are accumulated in memory and reversed at the end
+        output_file = None
+        out_writer = None
+        if backwards:
+            output_file = AudioFile(rconf=self.rconf)
+            output_file.audio_format = codec
+            output_file.audio_channels = 1
+            output_file.audio_sample_rate = sample_rate
+        else:
+            logger.debug("Streaming audio file %r", output_file_path)
+            out_writer = wave.open(output_file_path, "wb")
+            out_writer.setnchannels(1)
+            out_writer.setsampwidth(2)
+            out_writer.setframerate(sample_rate)
+
+        with out_writer or contextlib.nullcontext():
+            succeeded, data = self._loop_fragments(
+                helper_function,
+                text_file,
+                quit_after,
+                backwards,
+                output_file,
+                out_writer,
+            )
+        if not succeeded:
+            return (False, None)
+        anchors, current_time, num_chars = data
+
+        if output_file is not None:
+            # minimize memory
+            logger.debug("Minimizing memory...")
+            output_file.minimize_memory()
+            logger.debug("Minimizing memory... done")
+
+            # we need to reverse the audio samples again
+            logger.debug("Reversing audio samples...")
+            output_file.reverse()
+            logger.debug("Reversing audio samples... done")
+
+            # write output file
+            logger.debug("Writing audio file %r", output_file_path)
+            output_file.write(file_path=output_file_path)
+
+        # return output
+        if backwards:
+            logger.warning(
+                "Please note that anchor time values do not make sense since backwards=True"
+            )
+        logger.debug("Returning %d time anchors", len(anchors))
+        logger.debug("Current time %.3f", current_time)
+        logger.debug("Synthesized %d characters", num_chars)
+        logger.debug("Calling TTS engine using multiple generic function... done")
+        return (True, (anchors, current_time, num_chars))
 
+    def _loop_fragments(
+        self, helper_function, text_file, quit_after, backwards, output_file, out_writer
+    ):
+        """
+        Synthesize the fragments of ``text_file`` in order,
+        either streaming the samples to ``out_writer``
+        or concatenating them to ``output_file``.
+
+        :rtype: tuple (result, (anchors, current_time, num_chars))
+
+        .. versionadded:: 1.7.4
+        """
         # create output
         anchors = []
         current_time = TimeValue("0.000")
@@ -774,7 +1015,12 @@ class BaseTTSWrapper(Configurable):
         fragments = text_file.fragments
         if backwards:
             fragments = fragments[::-1]
-        loop_function = self._loop_use_cache if self.use_cache else self._loop_no_cache
+        if self.disk_cache is not None:
+            loop_function = self._loop_use_disk_cache
+        elif self.use_cache:
+            loop_function = self._loop_use_cache
+        else:
+            loop_function = self._loop_no_cache
         for num, fragment in enumerate(fragments):
             succeeded, data = loop_function(
                 helper_function=helper_function, num=num, fragment=fragment
@@ -792,7 +1038,12 @@ class BaseTTSWrapper(Configurable):
             if duration > 0:
                 logger.debug("Fragment %d duration: %.3f", num, duration)
                 current_time += duration
-                output_file.add_samples(samples, reverse=backwards)
+                if out_writer is not None:
+                    # our value is a float64 in [-1, 1],
+                    # written as a little-endian int16_t
+                    out_writer.writeframes((samples * 32768).astype("<i2").tobytes())
+                else:
+                    output_file.add_samples(samples, reverse=backwards)
             else:
                 logger.debug("Fragment %d has zero duration", num)
             # check if we must stop synthesizing because we have enough audio
@@ -800,30 +1051,6 @@ class BaseTTSWrapper(Configurable):
                 logger.debug("Quitting after reached duration %.3f", current_time)
                 break
 
-        # minimize memory
-        logger.debug("Minimizing memory...")
-        output_file.minimize_memory()
-        logger.debug("Minimizing memory... done")
-
-        # if backwards, we need to reverse the audio samples again
-        if backwards:
-            logger.debug("Reversing audio samples...")
-            output_file.reverse()
-            logger.debug("Reversing audio samples... done")
-
-        # write output file
-        logger.debug("Writing audio file %r", output_file_path)
-        output_file.write(file_path=output_file_path)
-
-        # return output
-        if backwards:
-            logger.warning(
-                "Please note that anchor time values do not make sense since backwards=True"
-            )
-        logger.debug("Returning %d time anchors", len(anchors))
-        logger.debug("Current time %.3f", current_time)
-        logger.debug("Synthesized %d characters", num_chars)
-        logger.debug("Calling TTS engine using multiple generic function... done")
         return (True, (anchors, current_time, num_chars))
 
     def _loop_no_cache(self, helper_function, num, fragment):
@@ -899,3 +1126,43 @@ class BaseTTSWrapper(Configurable):
             gf.close_file_handler(file_handler)
         logger.debug("Examining fragment %d (cache)... done", num)
         return (True, data)
+
+    def _loop_use_disk_cache(self, helper_function, num, fragment):
+        """Synthesize all fragments using the persistent cache"""
+        logger.debug("Examining fragment %d (persistent cache)...", num)
+        voice_code = self._language_to_voice_code(fragment.language)
+        key = self.disk_cache.key(
+            self.__class__.__name__, voice_code, fragment.filtered_text
+        )
+        cached = self.disk_cache.get(key)
+        if cached is not None:
+            sample_rate, samples = cached
+            # NOTE samples cached with a different sample rate
+            #      are synthesized again, and replaced
+            if sample_rate == self.rconf.sample_rate:
+                logger.debug("Fragment cached: using the cached samples")
+                duration = TimeValue(len(samples)) / TimeValue(sample_rate)
+                logger.debug("Examining fragment %d (persistent cache)... done", num)
+                return (True, (duration, sample_rate, "pcm_s16le", samples))
+
+        logger.debug("Fragment not cached: synthesizing and caching")
+        logger.debug("Calling helper function")
+        succeeded, data = helper_function(
+            text=fragment.filtered_text,
+            voice_code=voice_code,
+            output_file_path=None,
+            return_audio_data=True,
+        )
+        if not succeeded:
+            logger.critical("An unexpected error occurred in helper_function")
+            return (False, None)
+        duration, sample_rate, enc_nu, samples = data
+        if duration > 0:
+            try:
+                self.disk_cache.put(key, sample_rate, samples)
+            except OSError:
+                logger.warning("Unable to add fragment %d to the cache", num)
+        else:
+            logger.debug("Fragment has zero duration, not adding it to cache")
+        logger.debug("Examining fragment %d (persistent cache)... done", num)
+        return (True, data)
@@ -342,6 +342,18 @@ class NuanceTTSWrapper(BaseTTSWrapper):
 
     def __init__(self, rconf=None):
         super().__init__(rconf=rconf)
+        self._session = None
+
+    def close(self):
+        """
+        Close the HTTP session, if any.
+
+        .. versionadded:: 1.7.4
+        """
+        if self._session is not None:
+            logger.debug("Closing HTTP session")
+            self._session.close()
+            self._session = None
 
     def _synthesize_single_python_helper(
         self, text, voice_code, output_file_path=None, return_audio_data=True
@@ -351,6 +363,10 @@ class NuanceTTSWrapper(BaseTTSWrapper):
 
         logger.debug("Importing requests... done")
 
+        # prepare session, reused by the following calls
+        if self._session is None:
+            self._session = requests.Session()
+
         # prepare request header and contents
         request_id = str(uuid.uuid4()).replace("-", "")[0:16]
         headers = {
@@ -378,7 +394,7 @@ class NuanceTTSWrapper(BaseTTSWrapper):
             logger.debug("Sleeping to throttle API usage... done")
             logger.debug("Posting...")
             try:
-                response = requests.post(url, data=text_to_synth, headers=headers)
+                response = self._session.post(url, data=text_to_synth, headers=headers)
             except Exception as exc:
                 raise ValueError(
                     "Unexpected exception on HTTP POST. Are you offline?"